@@ -16,12 +16,20 @@ Output:
     - Output location configurable (local or network drive)
 
 Requirements:
-    pip install pandas pyarrow
+    pip install numpy pandas pyarrow
 """
 
+import io
 import os
+import csv
+import contextlib
+import concurrent.futures
+import numpy as np
 import pandas as pd
 import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pa_csv
+import pyarrow.dataset as pds
 import pyarrow.parquet as pq
 from datetime import datetime
 from pathlib import Path
@@ -49,12 +57,29 @@ FILE_PATTERNS = {
 }
 
 # Compression options: 'snappy' (fast), 'gzip' (smaller), 'zstd' (balanced)
-COMPRESSION = "snappy"
+# zstd level 3 gives ~20% smaller files than snappy at about the same write speed
+COMPRESSION = "zstd"
+COMPRESSION_LEVEL = 3
+
+# Rows per Parquet row group - larger groups compress better and mean fewer
+# row-group headers for PowerBI to scan
+ROW_GROUP_SIZE = 500_000
+
+# Rows are clustered by these columns before writing: better dictionary/RLE
+# runs, and tight per-row-group min/max statistics for PowerBI filters
+SORT_COLS = ["video_id", "date"]
+
+# Partitioned output: row-group and file size caps per partition
+PARTITION_ROWS_PER_GROUP = 128_000
+PARTITION_ROWS_PER_FILE = 2_000_000
 
 # Partitioning - enables faster filtered queries in PowerBI
 # Options: None, ["channel"], ["channel", "year"], ["year", "month"]
 PARTITION_COLS = None  # Set to ["channel"] for partitioned output
 
+# Parallel conversion - one worker process per CSV file, up to the core count
+MAX_WORKERS = os.cpu_count() or 1
+
 # =============================================================================
 # SCHEMA DEFINITION - Ensures proper data types for PowerBI
 # =============================================================================
@@ -76,7 +101,7 @@ COLUMN_DTYPES = {
     "published_at": "datetime64[ns]",
     "report_generated_on": "datetime64[ns]",
 
-    # Integer metrics (nullable Int64 for potential nulls)
+    # Integer metrics (nullable for potential nulls)
     "video_view": "Int64",
     "video_impression": "Int64",
     "video_seconds_viewed": "Int64",
@@ -87,14 +112,15 @@ COLUMN_DTYPES = {
     "video_duration": "Int64",
 
     # Float metrics (engagement scores and rates)
-    "play_rate": "float64",
-    "engagement_score": "float64",
-    "video_engagement_1": "float64",
-    "video_engagement_25": "float64",
-    "video_engagement_50": "float64",
-    "video_engagement_75": "float64",
-    "video_engagement_100": "float64",
-    "video_percent_viewed": "float64",
+    # float32 is ample for ratios/percentages and halves the column size
+    "play_rate": "float32",
+    "engagement_score": "float32",
+    "video_engagement_1": "float32",
+    "video_engagement_25": "float32",
+    "video_engagement_50": "float32",
+    "video_engagement_75": "float32",
+    "video_engagement_100": "float32",
+    "video_percent_viewed": "float32",
 
     # Categorical/text fields
     "video_content_type": "string",
@@ -106,6 +132,22 @@ COLUMN_DTYPES = {
     "tags": "string",
 }
 
+# Fixed parse formats for date columns - skips pandas' per-value format inference.
+# CMS timestamps vary in fractional seconds, so they use the fast ISO8601 path.
+DATE_FORMATS = {
+    "date": "%Y-%m-%d",
+    "created_at": "ISO8601",
+    "published_at": "ISO8601",
+    "report_generated_on": "%Y-%m-%d",
+}
+
+# Low-cardinality text columns stored as pandas category / Arrow dictionary
+# so each distinct value is held once instead of once per row
+CATEGORICAL_COLS = {
+    "channel", "country", "language", "business_unit", "video_content_type",
+    "video_length", "video_category", "created_by", "day_of_week", "year_month",
+}
+
 # PyArrow schema for explicit typing
 PYARROW_SCHEMA = pa.schema([
     ("channel", pa.string()),
@@ -115,21 +157,21 @@ PYARROW_SCHEMA = pa.schema([
     ("date", pa.timestamp("ns")),
     ("video_view", pa.int64()),
     ("video_impression", pa.int64()),
-    ("play_rate", pa.float64()),
-    ("engagement_score", pa.float64()),
-    ("video_engagement_1", pa.float64()),
-    ("video_engagement_25", pa.float64()),
-    ("video_engagement_50", pa.float64()),
-    ("video_engagement_75", pa.float64()),
-    ("video_engagement_100", pa.float64()),
-    ("video_percent_viewed", pa.float64()),
+    ("play_rate", pa.float32()),
+    ("engagement_score", pa.float32()),
+    ("video_engagement_1", pa.float32()),
+    ("video_engagement_25", pa.float32()),
+    ("video_engagement_50", pa.float32()),
+    ("video_engagement_75", pa.float32()),
+    ("video_engagement_100", pa.float32()),
+    ("video_percent_viewed", pa.float32()),
     ("video_seconds_viewed", pa.int64()),
     ("views_desktop", pa.int64()),
     ("views_mobile", pa.int64()),
     ("views_tablet", pa.int64()),
     ("views_other", pa.int64()),
-    ("created_at", pa.timestamp("ns")),
-    ("published_at", pa.timestamp("ns")),
+    ("created_at", pa.timestamp("ns", tz="UTC")),  # CMS timestamps end in 'Z'
+    ("published_at", pa.timestamp("ns", tz="UTC")),
     ("original_filename", pa.string()),
     ("created_by", pa.string()),
     ("tags", pa.string()),
@@ -144,6 +186,32 @@ PYARROW_SCHEMA = pa.schema([
     ("report_generated_on", pa.timestamp("ns")),
 ])
 
+# Replace plain strings with dictionary<int32, string> for categorical columns
+PYARROW_SCHEMA = pa.schema([
+    pa.field(field.name, pa.dictionary(pa.int32(), pa.string()))
+    if field.name in CATEGORICAL_COLS else field
+    for field in PYARROW_SCHEMA
+])
+
+# Only these columns are parsed; anything else in the CSV is skipped by the reader
+KEEP_COLUMNS = PYARROW_SCHEMA.names
+
+# Columns added by add_derived_columns / add_derived_columns_arrow
+DERIVED_SCHEMA = pa.schema([
+    ("year", pa.int64()),
+    ("month", pa.int64()),
+    ("year_month", pa.dictionary(pa.int32(), pa.string())),
+    ("day_of_week", pa.dictionary(pa.int32(), pa.string())),
+    ("views_total_devices", pa.int64()),
+])
+
+# Lookups derived once from the definitions above instead of per file / per column
+_ARROW_TYPES = {field.name: field.type for field in PYARROW_SCHEMA}
+_DECLARED_FIELDS = {field.name: field for field in (*PYARROW_SCHEMA, *DERIVED_SCHEMA)}
+_KEEP_COLUMNS_SET = set(KEEP_COLUMNS)
+_PD_READ_DTYPES = {col: dtype for col, dtype in COLUMN_DTYPES.items() if dtype == "string"}
+_DATE_COLS = [col for col, dtype in COLUMN_DTYPES.items() if "datetime" in dtype]
+
 
 # =============================================================================
 # HELPER FUNCTIONS
@@ -152,21 +220,23 @@ PYARROW_SCHEMA = pa.schema([
 def find_csv_files(base_dir: Path, years: list) -> list:
     """
     Find all daily analytics CSV files in year folders and base directory.
+    Returns each file once, in a deterministic (name-sorted) order.
     """
-    csv_files = []
+    search_dirs = [base_dir / year for year in years]  # Output from Script 3
+    search_dirs.append(base_dir)  # Output from Script 4 or manual placement
 
-    # Search in year folders (output from Script 3)
-    for year in years:
-        year_dir = base_dir / year
-        if year_dir.exists():
-            for csv_file in year_dir.glob("daily_analytics_*.csv"):
+    seen = set()
+    csv_files = []
+    for search_dir in search_dirs:
+        if not search_dir.exists():
+            continue
+        for csv_file in search_dir.glob("daily_analytics_*.csv"):
+            csv_file = csv_file.resolve()
+            if csv_file not in seen:
+                seen.add(csv_file)
                 csv_files.append(csv_file)
 
-    # Search in base directory (output from Script 4 or manual placement)
-    for csv_file in base_dir.glob("daily_analytics_*.csv"):
-        csv_files.append(csv_file)
-
-    return list(set(csv_files))  # Remove duplicates
+    return sorted(csv_files, key=lambda path: (path.name, str(path)))
 
 
 def apply_dtypes(df: pd.DataFrame) -> pd.DataFrame:
@@ -179,52 +249,315 @@ def apply_dtypes(df: pd.DataFrame) -> pd.DataFrame:
             continue
 
         try:
-            if "datetime" in dtype:
-                # Parse dates with error handling
-                df[col] = pd.to_datetime(df[col], errors="coerce")
-            elif dtype == "string":
-                # Convert to string, handling NaN
-                df[col] = df[col].astype("string")
-            elif dtype == "Int64":
+            if col in _DATE_COLS:
+                # Known formats skip per-value format inference
+                df[col] = pd.to_datetime(
+                    df[col], format=DATE_FORMATS.get(col), errors="coerce", cache=True
+                )
+            elif dtype.startswith("Int"):
                 # Nullable integer type
-                df[col] = pd.to_numeric(df[col], errors="coerce").astype("Int64")
-            elif dtype == "float64":
-                df[col] = pd.to_numeric(df[col], errors="coerce").astype("float64")
+                numeric = pd.to_numeric(df[col], errors="coerce")
+                try:
+                    df[col] = numeric.astype(dtype)
+                except (TypeError, ValueError):
+                    # Fractional values (e.g. "12.7") are nulled like unparseable ones
+                    numeric = numeric.astype("float64")
+                    df[col] = numeric.where(numeric % 1 == 0).astype(dtype)
+            elif dtype.startswith("float"):
+                df[col] = pd.to_numeric(df[col], errors="coerce").astype(dtype)
+            elif col in CATEGORICAL_COLS:
+                df[col] = df[col].astype("category")
+            else:
+                df[col] = df[col].astype(dtype)
         except Exception as e:
             print(f"  Warning: Could not convert column '{col}' to {dtype}: {e}")
 
     return df
 
 
-def add_derived_columns(df: pd.DataFrame) -> pd.DataFrame:
+# Date parts add_derived_columns can derive, and the ones kept by default
+DATE_PART_COLS = ("year", "month", "year_month", "day_of_week")
+DEFAULT_DATE_PARTS = ("year", "month")
+
+# Weekday names indexed by pandas/Arrow dayofweek (Monday=0)
+DAY_NAMES = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
+
+
+def add_derived_columns(df: pd.DataFrame, date_parts=DEFAULT_DATE_PARTS) -> pd.DataFrame:
     """
     Add useful derived columns for PowerBI reporting.
+    date_parts selects which of DATE_PART_COLS are derived from the date column.
     """
-    if "date" in df.columns and df["date"].notna().any():
+    if "date" in df.columns and df["date"].notna().any() and date_parts:
         # Extract year/month for partitioning and filtering
-        df["year"] = df["date"].dt.year.astype("Int64")
-        df["month"] = df["date"].dt.month.astype("Int64")
-        df["year_month"] = df["date"].dt.to_period("M").astype("string")
-        df["day_of_week"] = df["date"].dt.day_name().astype("string")
+        year = df["date"].dt.year.astype("Int64")
+        month = df["date"].dt.month.astype("Int64")
+        if "year" in date_parts:
+            df["year"] = year
+        if "month" in date_parts:
+            df["month"] = month
+
+        if "year_month" in date_parts:
+            # Format each distinct year/month once instead of every row via Period objects
+            codes, year_months = pd.factorize(year * 100 + month)
+            df["year_month"] = pd.Categorical.from_codes(
+                codes, [f"{ym // 100:04d}-{ym % 100:02d}" for ym in year_months]
+            )
+        if "day_of_week" in date_parts:
+            weekdays = df["date"].dt.dayofweek.to_numpy(dtype=np.int64, na_value=-1)
+            df["day_of_week"] = pd.Categorical.from_codes(weekdays, DAY_NAMES)
 
     # Total device views (if device columns exist)
     device_cols = ["views_desktop", "views_mobile", "views_tablet", "views_other"]
     if all(col in df.columns for col in device_cols):
-        df["views_total_devices"] = (
-            df["views_desktop"].fillna(0) +
-            df["views_mobile"].fillna(0) +
-            df["views_tablet"].fillna(0) +
-            df["views_other"].fillna(0)
-        ).astype("Int64")
+        # One pass over a contiguous int64 block instead of fillna + add per column
+        totals = df[device_cols].to_numpy(dtype=np.int64, na_value=0).sum(axis=1)
+        df["views_total_devices"] = pd.array(totals, dtype="Int64")
 
     return df
 
 
+def add_derived_columns_arrow(table, date_parts=DEFAULT_DATE_PARTS):
+    """
+    Arrow equivalent of add_derived_columns, computed with pyarrow.compute kernels.
+    Works on a pa.Table or a single pa.RecordBatch; the derived columns depend
+    only on which columns exist, so every batch of a stream gets the same schema.
+    """
+    if "date" in table.column_names:
+        dates = table["date"]
+        if "year" in date_parts:
+            table = table.append_column("year", pc.year(dates))
+        if "month" in date_parts:
+            table = table.append_column("month", pc.month(dates))
+        if "year_month" in date_parts:
+            table = table.append_column(
+                "year_month", pc.dictionary_encode(pc.strftime(dates, format="%Y-%m"))
+            )
+        if "day_of_week" in date_parts:
+            table = table.append_column(
+                "day_of_week", pc.dictionary_encode(pc.strftime(dates, format="%A"))
+            )
+
+    device_cols = ["views_desktop", "views_mobile", "views_tablet", "views_other"]
+    if all(col in table.column_names for col in device_cols):
+        desktop, mobile, tablet, other = (pc.fill_null(table[col], 0) for col in device_cols)
+        table = table.append_column(
+            "views_total_devices",
+            pc.add_checked(pc.add_checked(desktop, mobile), pc.add_checked(tablet, other)),
+        )
+
+    return table
+
+
+def sort_for_parquet(table):
+    """
+    Sort a pa.Table or pa.RecordBatch by SORT_COLS (those that are present).
+    """
+    keys = [(col, "ascending") for col in SORT_COLS if col in table.column_names]
+    return table.sort_by(keys) if keys else table
+
+
+def date_parts_for(partition_cols: list) -> tuple:
+    """
+    Date parts to derive for an output layout.
+    Partitioned output only needs the parts used as partition keys (Hive
+    partitioning stores them in the directory path, not in the data files);
+    single-file output keeps year/month and leaves year_month/day_of_week
+    for PowerBI to derive from the date column.
+    """
+    if partition_cols:
+        return tuple(col for col in partition_cols if col in DATE_PART_COLS)
+    return DEFAULT_DATE_PARTS
+
+
+def csv_read_options() -> pa_csv.ReadOptions:
+    """Arrow CSV read options (multithreaded, 64 MB blocks)."""
+    return pa_csv.ReadOptions(use_threads=True, block_size=64 * 1024 * 1024)
+
+
+def csv_convert_options() -> pa_csv.ConvertOptions:
+    """Arrow CSV convert options typing columns by PYARROW_SCHEMA."""
+    return pa_csv.ConvertOptions(
+        column_types=_ARROW_TYPES,
+        # Projection pushdown - unknown columns are never tokenized, and
+        # missing ones come back as typed nulls so every file has one schema
+        include_columns=KEEP_COLUMNS,
+        include_missing_columns=True,
+        strings_can_be_null=True,
+        # All date columns are ISO-8601 - use Arrow's native parser, not strptime
+        timestamp_parsers=[pa_csv.ISO8601],
+    )
+
+
+def read_csv_arrow(csv_path: Path) -> pa.Table:
+    """
+    Read a CSV directly into an Arrow table typed by PYARROW_SCHEMA.
+    Uses Arrow's multithreaded C++ parser, so no pandas object columns are built.
+    """
+    # Memory-mapped source: Arrow parses straight from the page cache
+    with pa.memory_map(str(csv_path), "r") as source:
+        return pa_csv.read_csv(
+            source,
+            read_options=csv_read_options(),
+            convert_options=csv_convert_options(),
+        )
+
+
+def _column_to_arrow(series: pd.Series, field: pa.Field) -> pa.Array:
+    """
+    Convert one column to its declared Arrow type without truncating values.
+    A column that does not fit keeps Arrow's inferred type, or becomes
+    strings if its values are too mixed to infer one.
+    """
+    try:
+        return pa.array(series, type=field.type, from_pandas=True)
+    except (pa.ArrowInvalid, pa.ArrowTypeError) as e:
+        print(f"  Warning: Could not convert column '{field.name}' to {field.type}: {e}")
+
+    try:
+        return pa.array(series, from_pandas=True)
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        return pa.array(series.astype("string"), from_pandas=True)
+
+
+def read_csv_pandas(csv_path: Path, date_parts=DEFAULT_DATE_PARTS) -> pa.Table:
+    """
+    Lenient pandas reader: bad values are coerced to null instead of failing.
+    """
+    # The pyarrow engine only accepts a column list, so intersect with the header
+    with open(csv_path, newline="", encoding="utf-8") as f:
+        header = next(csv.reader(f), [])
+    usecols = [col for col in header if col in _KEEP_COLUMNS_SET]
+
+    # Arrow-backed columns, so the final conversion to a Table needs no copy.
+    # Only strings get a read dtype - numeric columns may hold bad values,
+    # which apply_dtypes coerces to null.
+    df = pd.read_csv(
+        csv_path,
+        engine="pyarrow",
+        dtype_backend="pyarrow",
+        usecols=usecols,
+        dtype={col: _PD_READ_DTYPES[col] for col in usecols if col in _PD_READ_DTYPES},
+    )
+    df = apply_dtypes(df)
+    df = add_derived_columns(df, date_parts)
+
+    # Use the declared types instead of re-inferring them
+    schema = pa.schema([_DECLARED_FIELDS[col] for col in df.columns])
+    try:
+        return pa.Table.from_pandas(df, schema=schema, preserve_index=False)
+    except (pa.ArrowInvalid, pa.ArrowTypeError) as e:
+        print(f"  Warning: Could not apply declared schema ({e}), converting column by column")
+
+    arrays = [_column_to_arrow(df[field.name], field) for field in schema]
+    return pa.Table.from_arrays(arrays, names=schema.names)
+
+
+def _print_arrow_fallback(error: Exception) -> None:
+    print(f"  Arrow reader failed ({str(error).splitlines()[0]}), falling back to pandas")
+
+
+def load_csv_table(csv_path: Path, date_parts=DEFAULT_DATE_PARTS) -> pa.Table:
+    """
+    Load a CSV as a typed Arrow table with derived columns.
+    Tries the fast Arrow reader first and falls back to pandas if a value
+    does not parse as its declared type.
+    """
+    try:
+        table = read_csv_arrow(csv_path)
+    except pa.ArrowInvalid as e:
+        _print_arrow_fallback(e)
+        return read_csv_pandas(csv_path, date_parts)
+
+    return add_derived_columns_arrow(table, date_parts)
+
+
+def parquet_write_options(schema: pa.Schema, compression: str, compression_level: int = None) -> dict:
+    """
+    Parquet writer options shared by single-file and partitioned output.
+
+    Float columns are written with BYTE_STREAM_SPLIT encoding (byte planes
+    compress far better than raw floats); every other column is dictionary
+    encoded - the two encodings are mutually exclusive per column.
+    """
+    float_cols = [field.name for field in schema if pa.types.is_floating(field.type)]
+    return {
+        "compression": compression,
+        "compression_level": compression_level,
+        "use_dictionary": [field.name for field in schema if field.name not in float_cols],
+        "column_encoding": {col: "BYTE_STREAM_SPLIT" for col in float_cols},
+        "data_page_size": 1024 * 1024,
+        "write_statistics": True,
+    }
+
+
+def stream_csv_to_parquet(
+    csv_path: Path,
+    output_path: Path,
+    compression: str,
+    compression_level: int = None,
+) -> tuple:
+    """
+    Stream a CSV into a single Parquet file one record batch at a time.
+    Peak memory stays at about one batch instead of the whole file, and the
+    CSV is memory-mapped rather than copied through a Python file object.
+
+    Returns:
+        (rows written, columns written, CSV bytes, Parquet bytes)
+        Byte counts come from the open files, so no stat() is needed afterwards
+        (each stat is a round-trip on network shares).
+    """
+    source = pa.memory_map(str(csv_path), "r")
+    sink = pa.OSFile(str(output_path), "wb")
+    writer = None
+    num_rows = 0
+    try:
+        reader = pa_csv.open_csv(
+            source,
+            read_options=csv_read_options(),
+            convert_options=csv_convert_options(),
+        )
+        for batch in reader:
+            # Batches map onto row groups, so sorting each one clusters every
+            # row group without holding the whole file in memory
+            batch = sort_for_parquet(add_derived_columns_arrow(batch))
+            if writer is None:
+                writer = pq.ParquetWriter(
+                    sink,
+                    batch.schema,
+                    **parquet_write_options(batch.schema, compression, compression_level),
+                )
+            writer.write_batch(batch, row_group_size=ROW_GROUP_SIZE)
+            num_rows += batch.num_rows
+
+        if writer is None:
+            # Header-only CSV - still write an (empty) file with the full schema
+            empty = add_derived_columns_arrow(reader.schema.empty_table())
+            writer = pq.ParquetWriter(
+                sink,
+                empty.schema,
+                **parquet_write_options(empty.schema, compression, compression_level),
+            )
+            writer.write_table(empty)
+
+        writer.close()
+        parquet_bytes = sink.tell()
+    finally:
+        if writer is not None:
+            writer.close()
+        sink.close()
+        csv_bytes = source.size()
+        source.close()
+
+    return num_rows, len(writer.schema), csv_bytes, parquet_bytes
+
+
 def convert_csv_to_parquet(
     csv_path: Path,
     output_dir: Path,
-    compression: str = "snappy",
-    partition_cols: list = None
+    compression: str = "zstd",
+    partition_cols: list = None,
+    compression_level: int = 3,
 ) -> Path:
     """
     Convert a single CSV file to Parquet format.
@@ -234,23 +567,13 @@ def convert_csv_to_parquet(
         output_dir: Directory for output Parquet file
         compression: Compression algorithm ('snappy', 'gzip', 'zstd')
         partition_cols: List of columns to partition by (optional)
+        compression_level: Codec-specific compression level (None for codec default)
 
     Returns:
         Path to output Parquet file/directory
     """
     print(f"\nProcessing: {csv_path.name}")
 
-    # Read CSV with low_memory=False to avoid dtype warnings
-    df = pd.read_csv(csv_path, low_memory=False)
-    print(f"  Rows: {len(df):,}")
-    print(f"  Columns: {len(df.columns)}")
-
-    # Apply proper data types
-    df = apply_dtypes(df)
-
-    # Add derived columns for better PowerBI experience
-    df = add_derived_columns(df)
-
     # Generate output filename
     output_name = csv_path.stem + ".parquet"
     output_path = output_dir / output_name
@@ -262,26 +585,64 @@ def convert_csv_to_parquet(
         # Partitioned output (creates directory structure)
         # Useful for very large datasets
         partition_path = output_dir / csv_path.stem
-        pq.write_to_dataset(
-            pa.Table.from_pandas(df),
-            root_path=str(partition_path),
-            partition_cols=partition_cols,
-            compression=compression,
+
+        # Read with proper data types and derived columns for better PowerBI experience
+        table = sort_for_parquet(load_csv_table(csv_path, date_parts_for(partition_cols)))
+        print(f"  Rows: {table.num_rows:,}")
+        print(f"  Columns: {table.num_columns}")
+
+        # Sum file sizes as the writer reports them instead of stat()-ing afterwards
+        written_files = []
+
+        # delete_matching replaces the partitions being written, so re-running
+        # does not leave duplicate files next to the new ones
+        pds.write_dataset(
+            table,
+            base_dir=str(partition_path),
+            format="parquet",
+            partitioning=partition_cols,
+            partitioning_flavor="hive",
+            file_options=pds.ParquetFileFormat().make_write_options(
+                **parquet_write_options(table.schema, compression, compression_level)
+            ),
+            max_rows_per_group=PARTITION_ROWS_PER_GROUP,
+            max_rows_per_file=PARTITION_ROWS_PER_FILE,
+            existing_data_behavior="delete_matching",
+            use_threads=True,
+            file_visitor=lambda written_file: written_files.append(written_file.size),
         )
+        parquet_size = sum(written_files) / (1024 * 1024)  # MB
+        print(f"  Parquet size: {parquet_size:.2f} MB in {len(written_files)} file(s)")
         print(f"  Output (partitioned): {partition_path}")
         return partition_path
     else:
-        # Single file output
-        df.to_parquet(
-            output_path,
-            engine="pyarrow",
-            compression=compression,
-            index=False,
-        )
+        # Single file output, streamed batch by batch
+        try:
+            num_rows, num_columns, csv_bytes, parquet_bytes = stream_csv_to_parquet(
+                csv_path, output_path, compression, compression_level
+            )
+        except pa.ArrowInvalid as e:
+            # Discard the partial file and redo the whole CSV leniently
+            _print_arrow_fallback(e)
+            output_path.unlink(missing_ok=True)
+            table = sort_for_parquet(read_csv_pandas(csv_path))
+            with pa.OSFile(str(output_path), "wb") as sink:
+                pq.write_table(
+                    table,
+                    sink,
+                    row_group_size=ROW_GROUP_SIZE,
+                    **parquet_write_options(table.schema, compression, compression_level),
+                )
+                parquet_bytes = sink.tell()
+            csv_bytes = csv_path.stat().st_size
+            num_rows, num_columns = table.num_rows, table.num_columns
+
+        print(f"  Rows: {num_rows:,}")
+        print(f"  Columns: {num_columns}")
 
         # Report file size comparison
-        csv_size = csv_path.stat().st_size / (1024 * 1024)  # MB
-        parquet_size = output_path.stat().st_size / (1024 * 1024)  # MB
+        csv_size = csv_bytes / (1024 * 1024)  # MB
+        parquet_size = parquet_bytes / (1024 * 1024)  # MB
         compression_ratio = (1 - parquet_size / csv_size) * 100 if csv_size > 0 else 0
 
         print(f"  CSV size: {csv_size:.2f} MB")
@@ -295,7 +656,8 @@ def convert_csv_to_parquet(
 def combine_and_convert(
     csv_files: list,
     output_path: Path,
-    compression: str = "snappy"
+    compression: str = "zstd",
+    compression_level: int = 3,
 ) -> Path:
     """
     Combine multiple CSV files into a single Parquet file.
@@ -303,32 +665,70 @@ def combine_and_convert(
     """
     print(f"\nCombining {len(csv_files)} files into single Parquet...")
 
-    dfs = []
+    tables = []
     for csv_path in csv_files:
-        df = pd.read_csv(csv_path, low_memory=False)
-        df = apply_dtypes(df)
-        df = add_derived_columns(df)
-        # Add source file info for traceability
-        df["source_file"] = csv_path.name
-        dfs.append(df)
+        table = load_csv_table(csv_path)
+        # Add source file info for traceability - one dictionary entry per
+        # file instead of the file name repeated on every row
+        source_file = pa.DictionaryArray.from_arrays(
+            pa.array(np.zeros(table.num_rows, dtype=np.int32)),
+            pa.array([csv_path.name], pa.string()),
+        )
+        table = table.append_column("source_file", source_file)
+        tables.append(table)
 
-    combined_df = pd.concat(dfs, ignore_index=True)
-    print(f"  Total rows: {len(combined_df):,}")
+    # Identical schemas concatenate without copying any buffers; otherwise
+    # permissive promotion fills columns missing from some files with nulls
+    if all(table.schema.equals(tables[0].schema) for table in tables):
+        combined = pa.concat_tables(tables)
+    else:
+        combined = pa.concat_tables(tables, promote_options="permissive")
+    del tables
+    combined = sort_for_parquet(combined)
+    print(f"  Total rows: {combined.num_rows:,}")
 
     # Ensure output directory exists
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
-    combined_df.to_parquet(
+    pq.write_table(
+        combined,
         output_path,
-        engine="pyarrow",
-        compression=compression,
-        index=False,
+        row_group_size=ROW_GROUP_SIZE,
+        **parquet_write_options(combined.schema, compression, compression_level),
     )
 
     print(f"  Output: {output_path}")
     return output_path
 
 
+def _convert_worker(
+    csv_path: Path,
+    output_dir: Path,
+    compression: str,
+    partition_cols: list,
+    compression_level: int,
+    arrow_threads: int,
+) -> tuple:
+    """
+    Process-pool entry point for convert_csv_to_parquet.
+    Captures the worker's console output so the parent can print it per file
+    instead of interleaving lines from several processes.
+    """
+    # Arrow parses with its own thread pool - split cores between workers
+    pa.set_cpu_count(arrow_threads)
+
+    log = io.StringIO()
+    with contextlib.redirect_stdout(log):
+        output_path = convert_csv_to_parquet(
+            csv_path,
+            output_dir,
+            compression=compression,
+            partition_cols=partition_cols,
+            compression_level=compression_level,
+        )
+    return output_path, log.getvalue()
+
+
 # =============================================================================
 # MAIN EXECUTION
 # =============================================================================
@@ -342,8 +742,11 @@ def main():
     print("=" * 60)
     print(f"Input directory: {INPUT_DIR}")
     print(f"Output directory: {OUTPUT_DIR}")
-    print(f"Compression: {COMPRESSION}")
+    print(f"Compression: {COMPRESSION} (level {COMPRESSION_LEVEL})")
     print(f"Partition columns: {PARTITION_COLS or 'None (single file)'}")
+    date_parts = date_parts_for(PARTITION_COLS)
+    print(f"Derived date columns: {', '.join(date_parts) or 'None (partition keys only)'}")
+    print("  (year_month/day_of_week are no longer stored - derive them from 'date' in PowerBI)")
 
     # Find all CSV files to convert
     csv_files = find_csv_files(INPUT_DIR, YEARS)
@@ -360,26 +763,39 @@ def main():
     for f in csv_files:
         print(f"  - {f.name}")
 
-    # Convert each file individually
+    # Convert each file individually - files are independent, so fan out
+    # across processes
     converted_files = []
-    for csv_file in csv_files:
-        try:
-            output_path = convert_csv_to_parquet(
+    workers = max(1, min(MAX_WORKERS, len(csv_files)))
+    arrow_threads = max(1, (os.cpu_count() or 1) // workers)
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = {
+            executor.submit(
+                _convert_worker,
                 csv_file,
                 OUTPUT_DIR,
-                compression=COMPRESSION,
-                partition_cols=PARTITION_COLS,
-            )
-            converted_files.append(output_path)
-        except Exception as e:
-            print(f"  ERROR converting {csv_file.name}: {e}")
+                COMPRESSION,
+                PARTITION_COLS,
+                COMPRESSION_LEVEL,
+                arrow_threads,
+            ): csv_file
+            for csv_file in csv_files
+        }
+        for future in concurrent.futures.as_completed(futures):
+            csv_file = futures[future]
+            try:
+                output_path, log = future.result()
+                print(log, end="")
+                converted_files.append(output_path)
+            except Exception as e:
+                print(f"\n  ERROR converting {csv_file.name}: {e}")
 
     # Optionally: Create a combined "master" Parquet file
     # Uncomment below if you want all data in one file for PowerBI
 
     # if len(csv_files) > 1:
     #     combined_output = OUTPUT_DIR / "brightcove_analytics_combined.parquet"
-    #     combine_and_convert(csv_files, combined_output, COMPRESSION)
+    #     combine_and_convert(csv_files, combined_output, COMPRESSION, COMPRESSION_LEVEL)
 
     print("\n" + "=" * 60)
     print("Conversion complete!")
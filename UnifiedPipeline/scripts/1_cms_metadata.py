@@ -48,6 +48,7 @@ from shared import (
     robust_api_call,
     save_checkpoint_atomic,
     load_checkpoint,
+    json_dumps_bytes,
 )
 
 # =============================================================================
@@ -200,8 +201,8 @@ def write_json_output(videos: list, output_path: Path, logger):
     """Write videos to JSON file."""
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
-    with open(output_path, 'w', encoding='utf-8') as f:
-        json.dump(videos, f, indent=2)
+    with open(output_path, 'wb') as f:
+        f.write(json_dumps_bytes(videos))
 
     logger.info(f"JSON written: {output_path} ({len(videos)} videos)")
 
@@ -25,17 +25,28 @@ Input:
     - output/cms/{account}_cms_metadata.json (from script 1)
     - secrets.json (credentials)
 
+Checkpoints:
+    - checkpoints/analytics_checkpoint.json (per-account status and windows)
+    - checkpoints/analytics_lastmap_{account}.jsonl (append-only last_map journal)
+
 Output:
     - output/analytics/{account}_dt_last_viewed.json ({video_id: date} mapping)
     - output/analytics/{account}_cms_enriched.json (CMS + dt_last_viewed)
 """
 
 import sys
+import os
+import re
 import json
+import hashlib
+import zipfile
 import argparse
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 from typing import Dict, List, Tuple, Optional
+from xml.sax.saxutils import escape as xml_escape
 from tqdm import tqdm
 import time
 
@@ -49,12 +60,21 @@ from shared import (
     get_output_paths,
     BrightcoveAuthManager,
     RetryConfig,
+    RetryExhaustedError,
+    calculate_delay,
+    create_http_session,
     robust_api_call,
+    analytics_item_count,
+    is_last_analytics_page,
     save_checkpoint_atomic,
     load_checkpoint,
     generate_windows,
     split_window,
     get_date_range_days,
+    json_dumps_bytes,
+    json_loads,
+    json_array_chunks,
+    write_bytes_atomic,
 )
 
 # =============================================================================
@@ -63,6 +83,101 @@ from shared import (
 
 SCRIPT_NAME = "2_dt_last_viewed"
 
+# Accounts are processed concurrently but share one checkpoint file.
+# Every mutation of the shared checkpoint dict and every save happens
+# under this lock, so a save never serializes a dict another thread is
+# in the middle of changing.
+CHECKPOINT_LOCK = threading.Lock()
+
+# Rewrite an account's last_map journal from scratch every N windows so
+# repeated updates to the same video don't make it grow without bound
+JOURNAL_COMPACT_EVERY = 50
+
+# Persist progress after this many windows or seconds, whichever comes
+# first, rather than after every window
+CHECKPOINT_EVERY_WINDOWS = 10
+CHECKPOINT_EVERY_SECONDS = 30
+
+
+# =============================================================================
+# LAST_MAP JOURNAL
+# =============================================================================
+#
+# The shared checkpoint only holds small per-account state (status, windows,
+# last_run_date). Each account's last_map lives in its own append-only JSONL
+# journal of {"vid": ..., "date": ...} records, so saving after a window
+# writes only the entries that window changed instead of re-serializing
+# every account's full map.
+
+class TrackedLastMap(dict):
+    """video_id -> date dict that remembers which keys changed since the last drain."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.changed = set()
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self.changed.add(key)
+
+    def drain_changes(self) -> Dict[str, str]:
+        """Return entries changed since the previous call and reset tracking."""
+        delta = {key: self[key] for key in self.changed}
+        self.changed = set()
+        return delta
+
+
+def get_journal_path(checkpoint_path: Path, account_name: str) -> Path:
+    """Path of the last_map journal for an account, next to the checkpoint."""
+    return checkpoint_path.parent / f"analytics_lastmap_{account_name}.jsonl"
+
+
+def load_last_map_journal(path: Path) -> Dict[str, str]:
+    """Rebuild last_map from a journal, keeping the max date per video."""
+    last_map = {}
+    if not path.exists():
+        return last_map
+
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                record = json_loads(line)
+            except ValueError:
+                # Torn final line from a crash mid-append
+                continue
+            video_id, date = record["vid"], record["date"]
+            if video_id not in last_map or date > last_map[video_id]:
+                last_map[video_id] = date
+
+    return last_map
+
+
+def _journal_lines(entries: Dict[str, str]) -> bytes:
+    return b"".join(
+        json_dumps_bytes({"vid": video_id, "date": date}, indent=False) + b"\n"
+        for video_id, date in entries.items()
+    )
+
+
+def append_last_map_journal(path: Path, delta: Dict[str, str]) -> None:
+    """Append changed last_map entries to the journal in a single write."""
+    if not delta:
+        return
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, 'ab') as f:
+        f.write(_journal_lines(delta))
+        f.flush()
+        os.fsync(f.fileno())
+
+
+def compact_last_map_journal(path: Path, last_map: Dict[str, str]) -> None:
+    """Atomically rewrite the journal with exactly one record per video."""
+    write_bytes_atomic(path, _journal_lines(last_map))
+
 
 # =============================================================================
 # DATE BOUNDS
@@ -73,7 +188,8 @@ def get_date_bounds(
     account_id: str,
     retry_config: RetryConfig,
     proxies: dict,
-    logger
+    logger,
+    session=None
 ) -> Tuple[str, str]:
     """
     Get the earliest and latest dates with any views for an account.
@@ -102,7 +218,9 @@ def get_date_bounds(
         params=params_asc,
         retry_config=retry_config,
         proxies=proxies,
-        logger=logger
+        logger=logger,
+        session=session,
+        auth_manager=auth_manager
     )
 
     if not response:
@@ -116,7 +234,6 @@ def get_date_bounds(
 
     # Get latest date
     params_desc = {**params_asc, "sort": "-date"}
-    headers = {"Authorization": f"Bearer {auth_manager.get_token()}"}
 
     response = robust_api_call(
         url=url,
@@ -124,7 +241,9 @@ def get_date_bounds(
         params=params_desc,
         retry_config=retry_config,
         proxies=proxies,
-        logger=logger
+        logger=logger,
+        session=session,
+        auth_manager=auth_manager
     )
 
     if not response:
@@ -145,19 +264,29 @@ def fetch_analytics_slice(
     account_id: str,
     from_date: str,
     to_date: str,
+    last_map: Dict[str, str],
     retry_config: RetryConfig,
     proxies: dict,
-    logger
-) -> List[Dict]:
+    logger,
+    page_concurrency: int = 1,
+    session=None
+) -> int:
     """
     Fetch analytics for a time window with pagination.
 
-    Returns list of {video, date, video_view} items.
+    The first page is fetched on its own. If the response reports the total
+    row count and more pages remain, they are fetched concurrently with up
+    to page_concurrency requests in flight.
+
+    Each page is folded into last_map as soon as it arrives, so only one
+    page of items is held at a time. Merging keeps the max date, so pages
+    merged before a failure are safe to keep when the window is retried.
+
+    Returns the number of rows fetched.
     """
     url = "https://analytics.api.brightcove.com/v1/data"
     limit = 10000
     offset = 0
-    all_items = []
 
     params = {
         "accounts": account_id,
@@ -174,8 +303,7 @@ def fetch_analytics_slice(
     # Reconciled data takes 24-72h to become available, so use live data for last 3 days
     if to_date != "now":
         try:
-            to_dt = datetime.strptime(to_date, "%Y-%m-%d")
-            days_ago = (datetime.now() - to_dt).days
+            days_ago = (date.today() - date.fromisoformat(to_date)).days
             if days_ago >= 3:
                 params["reconciled"] = "true"
             # else: use live data (no reconciled param)
@@ -183,35 +311,52 @@ def fetch_analytics_slice(
             # If date parsing fails, default to reconciled
             params["reconciled"] = "true"
 
-    while True:
-        headers = {"Authorization": f"Bearer {auth_manager.get_token()}"}
-        params["offset"] = offset
+    # Token is looked up once per window; robust_api_call refreshes it in
+    # place on a 401 if it expires mid-window
+    headers = {"Authorization": f"Bearer {auth_manager.get_token()}"}
 
+    def fetch_page(page_offset: int) -> Dict:
         response = robust_api_call(
             url=url,
             headers=headers,
-            params=params,
+            params={**params, "offset": page_offset},
             retry_config=retry_config,
             proxies=proxies,
-            logger=logger
+            logger=logger,
+            raise_on_failure=True,
+            session=session,
+            auth_manager=auth_manager
         )
 
-        if not response:
-            raise RuntimeError(
-                f"Failed to fetch analytics for window {from_date} to {to_date}"
-            )
+        return response.json()
+
+    while True:
+        data = fetch_page(offset)
 
-        items = response.json().get("items", [])
+        items = data.get("items", [])
         if not items:
             break
 
-        all_items.extend(items)
+        merge_last_views(last_map, items)
         offset += len(items)
 
-        if len(items) < limit:
+        # Stop on a short page, or once offset reaches the reported
+        # item_count instead of paying a round-trip for the empty page
+        if is_last_analytics_page(data, len(items), offset, limit):
+            break
+
+        # item_count known: request all remaining pages at once
+        total = analytics_item_count(data)
+        if page_concurrency > 1 and total is not None:
+            offsets = list(range(offset, total, limit))
+            with ThreadPoolExecutor(max_workers=min(page_concurrency, len(offsets))) as executor:
+                for page in executor.map(fetch_page, offsets):
+                    items = page.get("items", [])
+                    merge_last_views(last_map, items)
+                    offset += len(items)
             break
 
-    return all_items
+    return offset
 
 
 def merge_last_views(last_map: Dict[str, str], items: List[Dict]) -> None:
@@ -219,6 +364,10 @@ def merge_last_views(last_map: Dict[str, str], items: List[Dict]) -> None:
     Update last_map with max date per video from items.
 
     Modifies last_map in place.
+
+    Kept as a plain loop: ISO dates compare correctly as strings, and each
+    page holds at most 10,000 items, too few for a DataFrame groupby-max
+    to recoup the cost of building the frame.
     """
     for item in items:
         video_id = item.get("video")
@@ -243,69 +392,107 @@ def process_window_with_splitting(
     retry_config: RetryConfig,
     proxies: dict,
     logger,
-    depth: int = 0
+    page_concurrency: int = 1,
+    session=None
 ) -> Tuple[bool, Optional[str]]:
     """
     Process a window, splitting on failure.
 
+    Windows are worked off a stack rather than by recursion. A window that
+    failed because the API kept throttling (429/503) is backed off and
+    retried whole up to retry_config.window_retries times before it is
+    split, since smaller windows would not help against rate limiting.
+
     Returns:
         Tuple of (success, error_message). error_message is None on success.
     """
-    max_depth = 5  # Prevent infinite recursion
-    window_key = f"{from_date}_{to_date}"
-
-    if depth > max_depth:
-        error_msg = f"Max split depth reached for window {window_key}"
-        logger.error(error_msg)
-        return False, error_msg
+    max_depth = 5  # Prevent unbounded splitting
+    throttle_codes = (429, 503)
 
-    try:
-        items = fetch_analytics_slice(
-            auth_manager=auth_manager,
-            account_id=account_id,
-            from_date=from_date,
-            to_date=to_date,
-            retry_config=retry_config,
-            proxies=proxies,
-            logger=logger
-        )
+    # (from_date, to_date, split depth, whole-window retry attempt)
+    stack = [(from_date, to_date, 0, 0)]
 
-        merge_last_views(last_map, items)
-        return True, None
+    while stack:
+        frm, to, depth, attempt = stack.pop()
+        window_key = f"{frm}_{to}"
 
-    except Exception as e:
-        days = get_date_range_days(from_date, to_date if to_date != "now" else datetime.now().strftime("%Y-%m-%d"))
+        if depth > max_depth:
+            error_msg = f"Max split depth reached for window {window_key}"
+            logger.error(error_msg)
+            return False, error_msg
 
-        if days > 1 and to_date != "now":
-            # Split and retry
-            logger.warning(
-                f"Window {window_key} failed ({e}). "
-                f"Splitting ({days} days -> 2 sub-windows)"
+        try:
+            fetch_analytics_slice(
+                auth_manager=auth_manager,
+                account_id=account_id,
+                from_date=frm,
+                to_date=to,
+                last_map=last_map,
+                retry_config=retry_config,
+                proxies=proxies,
+                logger=logger,
+                page_concurrency=page_concurrency,
+                session=session
             )
+            continue
+
+        except Exception as e:
+            status = e.status_code if isinstance(e, RetryExhaustedError) else None
 
-            sub_windows = split_window(from_date, to_date)
-
-            for sub_from, sub_to in sub_windows:
-                success, error = process_window_with_splitting(
-                    auth_manager=auth_manager,
-                    account_id=account_id,
-                    from_date=sub_from,
-                    to_date=sub_to,
-                    last_map=last_map,
-                    retry_config=retry_config,
-                    proxies=proxies,
-                    logger=logger,
-                    depth=depth + 1
+            if status in throttle_codes and attempt < retry_config.window_retries:
+                delay = calculate_delay(attempt, retry_config)
+                logger.warning(
+                    f"Window {window_key} throttled ({status}). Waiting {delay:.1f}s "
+                    f"before retrying whole window (attempt {attempt + 1}/{retry_config.window_retries})"
+                )
+                time.sleep(delay)
+                stack.append((frm, to, depth, attempt + 1))
+                continue
+
+            # Live windows ending "now" are never split
+            days = get_date_range_days(frm, to) if to != "now" else 0
+
+            if days > 1:
+                # Split and retry
+                logger.warning(
+                    f"Window {window_key} failed ({e}). "
+                    f"Splitting ({days} days -> 2 sub-windows)"
                 )
-                if not success:
-                    return False, error
 
-            return True, None
+                # Push in reverse so sub-windows are processed in date order
+                for sub_from, sub_to in reversed(split_window(frm, to)):
+                    stack.append((sub_from, sub_to, depth + 1, 0))
+            else:
+                # Cannot split further or is live window
+                error_msg = str(e)
+                logger.error(f"Window {window_key} permanently failed: {error_msg}")
+                return False, error_msg
+
+    return True, None
+
+
+def failed_windows_to_dict(failed_windows: List) -> Dict[str, Dict]:
+    """
+    Index a checkpoint's windows_failed list by window key.
+
+    Accepts both the old plain-string entries and the newer
+    {"window", "error", "timestamp"} dicts.
+    """
+    failed_map = {}
+    for item in failed_windows:
+        if isinstance(item, dict):
+            details = dict(item)
+            window_key = details.pop("window", None)
         else:
-            # Cannot split further or is live window
-            error_msg = str(e)
-            logger.error(f"Window {window_key} permanently failed: {error_msg}")
-            return False, error_msg
+            window_key, details = item, {}
+        if window_key:
+            failed_map[window_key] = details
+    return failed_map
+
+
+def failed_windows_to_list(failed_map: Dict[str, Dict]) -> List[Dict]:
+    """Convert the window-keyed failure dict back to the on-disk list format."""
+    return [{"window": window_key, **details} for window_key, details in failed_map.items()]
 
 
 def process_account(
@@ -319,7 +506,9 @@ def process_account(
     checkpoint: dict,
     logger,
     overlap_days: int = 3,
-    retry_failed: bool = False
+    retry_failed: bool = False,
+    page_concurrency: int = 1,
+    session=None
 ) -> Dict[str, str]:
     """
     Process all windows for an account with checkpointing.
@@ -329,32 +518,34 @@ def process_account(
 
     Args:
         retry_failed: If True, only retry previously failed windows.
+        page_concurrency: Max concurrent page requests within one window.
+        session: Shared requests.Session for connection reuse.
 
     Returns:
         Dict mapping video_id -> dt_last_viewed
     """
     # Get or initialize account checkpoint
-    if account_name not in checkpoint["accounts"]:
-        checkpoint["accounts"][account_name] = {
-            "status": "pending",
-            "windows_completed": [],
-            "windows_failed": [],
-            "last_map": {},
-            "last_updated": None,
-            "last_run_date": None
-        }
-
-    account_chk = checkpoint["accounts"][account_name]
-
-    # Ensure last_run_date field exists (for backwards compatibility)
-    # If missing but last_updated exists, derive from it
-    if "last_run_date" not in account_chk or account_chk["last_run_date"] is None:
-        if account_chk.get("last_updated"):
-            # Extract date from ISO timestamp (e.g., "2026-01-12T14:30:00" -> "2026-01-12")
-            account_chk["last_run_date"] = account_chk["last_updated"][:10]
-            logger.info(f"Migrated last_run_date from last_updated: {account_chk['last_run_date']}")
-        else:
-            account_chk["last_run_date"] = None
+    with CHECKPOINT_LOCK:
+        if account_name not in checkpoint["accounts"]:
+            checkpoint["accounts"][account_name] = {
+                "status": "pending",
+                "windows_completed": [],
+                "windows_failed": [],
+                "last_updated": None,
+                "last_run_date": None
+            }
+
+        account_chk = checkpoint["accounts"][account_name]
+
+        # Ensure last_run_date field exists (for backwards compatibility)
+        # If missing but last_updated exists, derive from it
+        if "last_run_date" not in account_chk or account_chk["last_run_date"] is None:
+            if account_chk.get("last_updated"):
+                # Extract date from ISO timestamp (e.g., "2026-01-12T14:30:00" -> "2026-01-12")
+                account_chk["last_run_date"] = account_chk["last_updated"][:10]
+                logger.info(f"Migrated last_run_date from last_updated: {account_chk['last_run_date']}")
+            else:
+                account_chk["last_run_date"] = None
 
     # Check if this is an incremental update (previously completed)
     is_incremental = (
@@ -364,32 +555,44 @@ def process_account(
 
     # Get date bounds from API
     first_date, last_date = get_date_bounds(
-        auth_manager, account_id, retry_config, proxies, logger
+        auth_manager, account_id, retry_config, proxies, logger, session=session
     )
 
     if not first_date:
         logger.warning(f"No analytics data found for {account_name}")
-        account_chk["status"] = "completed"
-        save_checkpoint_atomic(checkpoint_path, checkpoint)
+        with CHECKPOINT_LOCK:
+            account_chk["status"] = "completed"
+            save_checkpoint_atomic(checkpoint_path, checkpoint)
         return {}
 
-    # Load existing last_map
-    last_map = account_chk["last_map"]
+    # Load existing last_map from the journal. Older checkpoints embedded
+    # the map directly; fold that in once and move it to the journal.
+    journal_path = get_journal_path(checkpoint_path, account_name)
+    last_map = TrackedLastMap(load_last_map_journal(journal_path))
+
+    with CHECKPOINT_LOCK:
+        legacy_map = account_chk.pop("last_map", None)
+
+    if legacy_map:
+        logger.info(f"Migrating {len(legacy_map)} last_map entries to {journal_path.name}")
+        for video_id, viewed in legacy_map.items():
+            if video_id not in last_map or viewed > last_map[video_id]:
+                last_map[video_id] = viewed
+        compact_last_map_journal(journal_path, last_map)
+        with CHECKPOINT_LOCK:
+            save_checkpoint_atomic(checkpoint_path, checkpoint)
+
+    last_map.changed.clear()
 
     # RETRY FAILED MODE: Only process previously failed windows
     if retry_failed:
-        failed_windows = account_chk.get("windows_failed", [])
+        failed_windows = failed_windows_to_dict(account_chk.get("windows_failed", []))
         if not failed_windows:
             logger.info(f"No failed windows to retry for {account_name}")
             return last_map
 
-        # Parse failed windows (handle both old string format and new dict format)
         pending_windows = []
-        for item in failed_windows:
-            if isinstance(item, dict):
-                window_key = item.get("window")
-            else:
-                window_key = item
+        for window_key in failed_windows:
             # Parse "YYYY-MM-DD_YYYY-MM-DD" format
             parts = window_key.split("_")
             if len(parts) == 2:
@@ -405,9 +608,9 @@ def process_account(
         last_run = account_chk["last_run_date"]
 
         # Calculate incremental start date with overlap buffer
-        last_run_dt = datetime.strptime(last_run, "%Y-%m-%d")
+        last_run_dt = date.fromisoformat(last_run)
         incremental_start_dt = last_run_dt - timedelta(days=overlap_days)
-        incremental_start = incremental_start_dt.strftime("%Y-%m-%d")
+        incremental_start = incremental_start_dt.isoformat()
 
         # Don't go before first_date
         if incremental_start < first_date:
@@ -442,59 +645,97 @@ def process_account(
         completed = set(account_chk["windows_completed"])
         pending_windows = [w for w in windows if f"{w[0]}_{w[1]}" not in completed]
 
-    # Process windows
-    account_chk["status"] = "in_progress"
+    # Process windows. Window bookkeeping is kept locally and only copied
+    # into the shared checkpoint when progress is flushed, so the checkpoint
+    # never marks a window done before its last_map delta is on disk.
+    with CHECKPOINT_LOCK:
+        account_chk["status"] = "in_progress"
+        # Keyed by window for O(1) dedup/removal; stored as a list on disk
+        failed_map = failed_windows_to_dict(account_chk["windows_failed"])
+
+    windows_since_save = 0
+    windows_since_compact = 0
+    last_save_ts = time.time()
+    # completed stays a set in memory; it is materialized as a list only
+    # when a flush follows newly completed windows
+    completed_changed = False
+
+    def flush_progress() -> None:
+        nonlocal windows_since_save, windows_since_compact, last_save_ts, completed_changed
+
+        # Persist the map delta before the windows are marked done, so a
+        # crash in between only causes those windows to be fetched again
+        if windows_since_compact >= JOURNAL_COMPACT_EVERY:
+            compact_last_map_journal(journal_path, last_map)
+            last_map.changed.clear()
+            windows_since_compact = 0
+        else:
+            append_last_map_journal(journal_path, last_map.drain_changes())
 
-    for from_date, to_date in tqdm(pending_windows, desc=f"Windows for {account_name}"):
-        window_key = f"{from_date}_{to_date}"
+        with CHECKPOINT_LOCK:
+            if not is_incremental and completed_changed:
+                # Only track windows_completed for full mode (resume capability)
+                account_chk["windows_completed"] = sorted(completed)
+                completed_changed = False
+            account_chk["windows_failed"] = failed_windows_to_list(failed_map)
+            account_chk["last_updated"] = datetime.now().isoformat()
+            save_checkpoint_atomic(checkpoint_path, checkpoint)
 
-        if window_key in completed:
-            continue
+        windows_since_save = 0
+        last_save_ts = time.time()
 
-        success, error_msg = process_window_with_splitting(
-            auth_manager=auth_manager,
-            account_id=account_id,
-            from_date=from_date,
-            to_date=to_date,
-            last_map=last_map,
-            retry_config=retry_config,
-            proxies=proxies,
-            logger=logger
-        )
+    try:
+        for from_date, to_date in tqdm(pending_windows, desc=f"Windows for {account_name}"):
+            window_key = f"{from_date}_{to_date}"
 
-        if success:
-            completed.add(window_key)
-            if not is_incremental:
-                # Only track windows_completed for full mode (resume capability)
-                account_chk["windows_completed"] = list(completed)
-            # Remove from windows_failed if this was a retry
-            if retry_failed:
-                account_chk["windows_failed"] = [
-                    f for f in account_chk["windows_failed"]
-                    if (f.get("window") if isinstance(f, dict) else f) != window_key
-                ]
-        else:
-            # Store failure with error message (avoid duplicates)
-            existing_keys = [
-                f.get("window") if isinstance(f, dict) else f
-                for f in account_chk["windows_failed"]
-            ]
-            if window_key not in existing_keys:
-                account_chk["windows_failed"].append({
-                    "window": window_key,
-                    "error": error_msg,
-                    "timestamp": datetime.now().isoformat()
-                })
-            logger.warning(f"Window failed: {from_date} to {to_date} - {error_msg}")
-
-        account_chk["last_map"] = last_map
-        account_chk["last_updated"] = datetime.now().isoformat()
-        save_checkpoint_atomic(checkpoint_path, checkpoint)
+            if window_key in completed:
+                continue
+
+            success, error_msg = process_window_with_splitting(
+                auth_manager=auth_manager,
+                account_id=account_id,
+                from_date=from_date,
+                to_date=to_date,
+                last_map=last_map,
+                retry_config=retry_config,
+                proxies=proxies,
+                logger=logger,
+                page_concurrency=page_concurrency,
+                session=session
+            )
+
+            if success:
+                completed.add(window_key)
+                completed_changed = True
+                # Remove from windows_failed if this was a retry
+                if retry_failed:
+                    failed_map.pop(window_key, None)
+            else:
+                # Store failure with error message (avoid duplicates)
+                if window_key not in failed_map:
+                    failed_map[window_key] = {
+                        "error": error_msg,
+                        "timestamp": datetime.now().isoformat()
+                    }
+                logger.warning(f"Window failed: {from_date} to {to_date} - {error_msg}")
+
+            windows_since_save += 1
+            windows_since_compact += 1
+            if (windows_since_save >= CHECKPOINT_EVERY_WINDOWS or
+                    time.time() - last_save_ts > CHECKPOINT_EVERY_SECONDS):
+                flush_progress()
+    finally:
+        # Also runs when a window raises, so finished work is not lost
+        if windows_since_save:
+            flush_progress()
+
+    compact_last_map_journal(journal_path, last_map)
 
     # Mark as completed and record last_run_date
-    account_chk["status"] = "completed"
-    account_chk["last_run_date"] = last_date  # The latest date we fetched up to
-    save_checkpoint_atomic(checkpoint_path, checkpoint)
+    with CHECKPOINT_LOCK:
+        account_chk["status"] = "completed"
+        account_chk["last_run_date"] = last_date  # The latest date we fetched up to
+        save_checkpoint_atomic(checkpoint_path, checkpoint)
 
     if is_incremental:
         logger.info(f"Incremental update completed. last_run_date updated to {last_date}")
@@ -506,16 +747,34 @@ def process_account(
 # OUTPUT GENERATION
 # =============================================================================
 
+def output_fingerprint(last_map: Dict[str, str], cms_path: Path) -> str:
+    """
+    Fingerprint the inputs of the per-account output files.
+
+    Covers the last_map contents and the CMS metadata file (size + mtime),
+    so a re-run of script 1 also invalidates the outputs.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(json_dumps_bytes(dict(sorted(last_map.items())), indent=False))
+    stat = cms_path.stat()
+    digest.update(f"{stat.st_size}:{stat.st_mtime_ns}".encode())
+    return digest.hexdigest()
+
+
+def get_lifecycle_excel_path(output_dir: Path, account_name: str, year_month: Optional[str] = None) -> Path:
+    """Excel path for year_month (default: current), e.g. life_cycle_mgmt/2026-01/{account}_cms.xlsx."""
+    if year_month is None:
+        year_month = datetime.now().strftime("%Y-%m")
+    return output_dir / year_month / f"{account_name}_cms.xlsx"
+
+
 def write_last_viewed_json(
     last_map: Dict[str, str],
     output_path: Path,
     logger
 ) -> None:
     """Write video_id -> dt_last_viewed mapping to JSON."""
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-
-    with open(output_path, 'w', encoding='utf-8') as f:
-        json.dump(last_map, f, indent=2)
+    write_bytes_atomic(output_path, json_dumps_bytes(last_map), fsync=False)
 
     logger.info(f"Last viewed data written: {output_path} ({len(last_map)} videos)")
 
@@ -533,8 +792,7 @@ def enrich_cms_metadata(
 
     Returns the enriched video list for further processing (Excel export).
     """
-    with open(cms_path, 'r', encoding='utf-8') as f:
-        videos = json.load(f)
+    videos = json_loads(cms_path.read_bytes())
 
     for video in videos:
         video_id = str(video.get("id"))  # Convert to string to match last_map keys
@@ -545,16 +803,20 @@ def enrich_cms_metadata(
         for key, value in cf.items():
             video[f"cf_{key}"] = value
 
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-
-    with open(output_path, 'w', encoding='utf-8') as f:
-        json.dump(videos, f, indent=2)
+    # Stream the array out in chunks rather than building one large buffer
+    write_bytes_atomic(output_path, json_array_chunks(videos), fsync=False)
 
     logger.info(f"Enriched CMS written: {output_path} ({len(videos)} videos)")
 
     return videos
 
 
+# Characters XML 1.0 (and so .xlsx) cannot hold, as one precompiled class:
+# C0 controls except tab/LF/CR, DEL and C1 controls (0x7F-0x9F),
+# the \uFFFE/\uFFFF non-characters and orphaned surrogates
+ILLEGAL_EXCEL_CHARS = re.compile(r'[\x00-\x08\x0B\x0C\x0E-\x1F\x7F-\x9F\uFFFE\uFFFF\uD800-\uDFFF]')
+
+
 def sanitize_for_excel(value) -> str:
     """
     Remove illegal characters that can't be written to Excel/XML.
@@ -562,50 +824,187 @@ def sanitize_for_excel(value) -> str:
     XML 1.0 doesn't allow certain control characters, and openpyxl
     will raise IllegalCharacterError if they're present.
     """
-    import re
-
     if value is None:
         return ""
 
-    # Convert to string
-    s = str(value)
+    return ILLEGAL_EXCEL_CHARS.sub('', str(value))
+
+
+# Minimal SpreadsheetML package parts for write_xlsx_fast. Style 1 is the
+# bold, bordered, centered header cell that df.to_excel would produce.
+_XLSX_CONTENT_TYPES = (
+    b'<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    b'<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+    b'<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+    b'<Default Extension="xml" ContentType="application/xml"/>'
+    b'<Override PartName="/xl/workbook.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+    b'<Override PartName="/xl/worksheets/sheet1.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+    b'<Override PartName="/xl/styles.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.styles+xml"/>'
+    b'</Types>'
+)
+_XLSX_ROOT_RELS = (
+    b'<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    b'<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    b'<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" Target="xl/workbook.xml"/>'
+    b'</Relationships>'
+)
+_XLSX_WORKBOOK = (
+    b'<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    b'<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+    b'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">'
+    b'<sheets><sheet name="Sheet1" sheetId="1" r:id="rId1"/></sheets>'
+    b'</workbook>'
+)
+_XLSX_WORKBOOK_RELS = (
+    b'<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    b'<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    b'<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet" Target="worksheets/sheet1.xml"/>'
+    b'<Relationship Id="rId2" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/styles" Target="styles.xml"/>'
+    b'</Relationships>'
+)
+_XLSX_STYLES = (
+    b'<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    b'<styleSheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
+    b'<fonts count="2">'
+    b'<font><sz val="11"/><name val="Calibri"/><family val="2"/></font>'
+    b'<font><b/><sz val="11"/><name val="Calibri"/><family val="2"/></font>'
+    b'</fonts>'
+    b'<fills count="2"><fill><patternFill patternType="none"/></fill><fill><patternFill patternType="gray125"/></fill></fills>'
+    b'<borders count="2">'
+    b'<border><left/><right/><top/><bottom/><diagonal/></border>'
+    b'<border><left style="thin"/><right style="thin"/><top style="thin"/><bottom style="thin"/><diagonal/></border>'
+    b'</borders>'
+    b'<cellStyleXfs count="1"><xf numFmtId="0" fontId="0" fillId="0" borderId="0"/></cellStyleXfs>'
+    b'<cellXfs count="2">'
+    b'<xf numFmtId="0" fontId="0" fillId="0" borderId="0" xfId="0"/>'
+    b'<xf numFmtId="0" fontId="1" fillId="0" borderId="1" xfId="0" applyFont="1" applyBorder="1" applyAlignment="1">'
+    b'<alignment horizontal="center" vertical="top"/></xf>'
+    b'</cellXfs>'
+    b'<cellStyles count="1"><cellStyle name="Normal" xfId="0" builtinId="0"/></cellStyles>'
+    b'</styleSheet>'
+)
+
+# Excel refuses cells longer than this
+EXCEL_MAX_STRING_LENGTH = 32767
+_XML_CR_ENTITY = {'\r': '&#13;'}
 
-    # Remove C0 control characters (except tab \x09, LF \x0A, CR \x0D)
-    s = re.sub(r'[\x00-\x08\x0B\x0C\x0E-\x1F\x7F]', '', s)
-    # Remove C1 control characters (0x80-0x9F)
-    s = re.sub(r'[\x80-\x9F]', '', s)
-    # Remove other problematic Unicode characters
-    s = re.sub(r'[\uFFFE\uFFFF]', '', s)
-    # Remove orphaned surrogate pairs
-    s = re.sub(r'[\uD800-\uDFFF]', '', s)
 
-    return s
+def _xlsx_column_letter(index: int) -> str:
+    """0-based column index -> Excel column letters (0 -> A, 26 -> AA)."""
+    letters = ''
+    index += 1
+    while index:
+        index, remainder = divmod(index - 1, 26)
+        letters = chr(65 + remainder) + letters
+    return letters
+
+
+def _xlsx_cell(ref: str, value) -> str:
+    """One <c> element for value, or '' for an empty cell."""
+    if value is None:
+        return ''
+    if isinstance(value, bool):
+        return f'<c r="{ref}" t="b"><v>{int(value)}</v></c>'
+    if isinstance(value, (int, float)):
+        if value != value or value in (float('inf'), float('-inf')):
+            return ''
+        return f'<c r="{ref}"><v>{value!r}</v></c>'
+
+    text = sanitize_for_excel(value)[:EXCEL_MAX_STRING_LENGTH]
+    if not text:
+        return ''
+    space = ' xml:space="preserve"' if text[0].isspace() or text[-1].isspace() else ''
+    # A literal CR would be normalized away by XML parsers
+    return f'<c r="{ref}" t="inlineStr"><is><t{space}>{xml_escape(text, _XML_CR_ENTITY)}</t></is></c>'
+
+
+def write_xlsx_fast(columns: List[str], rows, excel_path: Path) -> None:
+    """
+    Write a plain single-sheet .xlsx by emitting the SpreadsheetML directly.
+
+    The sheet XML is streamed into the zip in chunks with inline strings,
+    so no workbook object or shared-string table is ever built; this is
+    several times faster than xlsxwriter's constant_memory mode and needs
+    only the standard library. Layout matches df.to_excel(index=False):
+    one "Sheet1" with a bold, bordered header row.
+
+    rows yields sequences of Python scalars aligned with columns; None
+    leaves the cell empty, other non-numbers are written as text.
+    """
+    letters = [_xlsx_column_letter(i) for i in range(len(columns))]
+    header_cells = ''.join(
+        f'<c r="{letter}1" s="1" t="inlineStr"><is><t>{xml_escape(sanitize_for_excel(name))}</t></is></c>'
+        for letter, name in zip(letters, columns)
+    )
+
+    excel_path = Path(excel_path)
+    temp_path = excel_path.with_name(excel_path.name + '.tmp')
+
+    try:
+        with zipfile.ZipFile(temp_path, 'w', zipfile.ZIP_DEFLATED) as zf:
+            zf.writestr('[Content_Types].xml', _XLSX_CONTENT_TYPES)
+            zf.writestr('_rels/.rels', _XLSX_ROOT_RELS)
+            zf.writestr('xl/workbook.xml', _XLSX_WORKBOOK)
+            zf.writestr('xl/_rels/workbook.xml.rels', _XLSX_WORKBOOK_RELS)
+            zf.writestr('xl/styles.xml', _XLSX_STYLES)
+
+            with zf.open('xl/worksheets/sheet1.xml', 'w', force_zip64=True) as sheet:
+                sheet.write(
+                    b'<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+                    b'<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
+                    b'<sheetData>'
+                )
+                chunk = [f'<row r="1">{header_cells}</row>']
+                for row_num, row in enumerate(rows, start=2):
+                    cells = ''.join(
+                        _xlsx_cell(f'{letter}{row_num}', value)
+                        for letter, value in zip(letters, row)
+                    )
+                    chunk.append(f'<row r="{row_num}">{cells}</row>')
+                    if len(chunk) >= 1000:
+                        sheet.write(''.join(chunk).encode('utf-8'))
+                        chunk = []
+                sheet.write(''.join(chunk).encode('utf-8'))
+                sheet.write(b'</sheetData></worksheet>')
+    except BaseException:
+        # Don't leave a half-written <name>.xlsx.tmp behind
+        temp_path.unlink(missing_ok=True)
+        raise
+
+    os.replace(temp_path, excel_path)
+
+
+def _tags_cell(value):
+    """Tags list -> comma-separated string for the lifecycle export."""
+    if isinstance(value, list):
+        return ','.join(value)
+    return value or None
+
+
+def _complex_cell(value):
+    """Nested CMS objects (images, schedule, ...) -> JSON string for the lifecycle export."""
+    if isinstance(value, (dict, list)):
+        return json.dumps(value)
+    return value or None
 
 
 def write_lifecycle_excel(
     videos: List[Dict],
     account_name: str,
     output_dir: Path,
-    logger
+    logger,
+    year_month: Optional[str] = None
 ) -> None:
     """
     Write enriched CMS data to Excel file for lifecycle management.
 
     Creates {account_name}_cms.xlsx in the life_cycle_mgmt/{YYYY-MM}/ folder,
-    where YYYY-MM is the current year-month (e.g., 2026-01).
+    where YYYY-MM is year_month or the current year-month (e.g., 2026-01).
     Format matches Harper's channel_cms.xlsx output.
     """
-    try:
-        import pandas as pd
-    except ImportError:
-        logger.warning("pandas not installed. Skipping Excel export. Install with: pip install pandas openpyxl")
-        return
-
     # Create year-month subfolder (e.g., 2026-01, 2026-02, ...)
-    year_month = datetime.now().strftime("%Y-%m")
-    year_month_dir = output_dir / year_month
-    year_month_dir.mkdir(parents=True, exist_ok=True)
-    excel_path = year_month_dir / f"{account_name}_cms.xlsx"
+    excel_path = get_lifecycle_excel_path(output_dir, account_name, year_month)
+    excel_path.parent.mkdir(parents=True, exist_ok=True)
 
     # Define column order (matching Harper format)
     # Fixed fields first, then cf_* fields
@@ -620,49 +1019,43 @@ def write_lifecycle_excel(
         'updated_by', 'playback_rights_id', 'ingestion_profile_id'
     ]
 
-    # Discover all cf_* fields
-    cf_columns = set()
-    for video in videos:
-        for key in video.keys():
-            if key.startswith('cf_'):
-                cf_columns.add(key)
-    cf_columns = sorted(list(cf_columns))
-
-    # Final column order
-    all_columns = fixed_columns + cf_columns
-
-    # Create DataFrame
-    df = pd.DataFrame(videos)
+    # Complex objects are written as JSON strings
+    complex_columns = ('images', 'geo', 'schedule', 'sharing', 'cue_points', 'text_tracks', 'transcripts', 'link')
 
-    # Handle tags - convert list to comma-separated string
-    if 'tags' in df.columns:
-        df['tags'] = df['tags'].apply(
-            lambda x: ','.join(x) if isinstance(x, list) else (x if x else '')
-        )
+    # Discover all columns in first-seen order
+    seen_columns = {}
+    for video in videos:
+        for key in video:
+            if key not in seen_columns:
+                seen_columns[key] = None
 
-    # Handle complex objects - convert to JSON strings
-    for col in ['images', 'geo', 'schedule', 'sharing', 'cue_points', 'text_tracks', 'transcripts', 'link']:
-        if col in df.columns:
-            df[col] = df[col].apply(
-                lambda x: json.dumps(x) if isinstance(x, (dict, list)) else (x if x else '')
-            )
+    cf_columns = sorted(c for c in seen_columns if c.startswith('cf_'))
 
-    # Reorder columns (only include columns that exist)
-    existing_columns = [c for c in all_columns if c in df.columns]
-    # Add any columns not in our predefined list
-    extra_columns = [c for c in df.columns if c not in existing_columns]
+    # Final column order (only include columns that exist), then any
+    # columns not in our predefined list
+    all_columns = fixed_columns + cf_columns
+    existing_columns = [c for c in all_columns if c in seen_columns]
+    existing_set = set(existing_columns)
+    extra_columns = [c for c in seen_columns if c not in existing_set]
     final_columns = existing_columns + extra_columns
 
-    df = df[final_columns]
-
-    # Sanitize all string columns to remove illegal XML characters
-    for col in df.columns:
-        if df[col].dtype == 'object':
-            df[col] = df[col].apply(lambda x: sanitize_for_excel(x) if pd.notna(x) else '')
+    # Per-column cell converters, resolved once instead of per cell
+    converters = [
+        _tags_cell if col == 'tags' else _complex_cell if col in complex_columns else None
+        for col in final_columns
+    ]
+    columns_with_converters = list(zip(final_columns, converters))
+
+    # Stream rows straight from the video dicts (text cells are sanitized
+    # of illegal XML characters as they are written)
+    rows = (
+        [convert(video.get(col)) if convert else video.get(col)
+         for col, convert in columns_with_converters]
+        for video in videos
+    )
 
-    # Write to Excel
     try:
-        df.to_excel(excel_path, index=False, engine='openpyxl')
+        write_xlsx_fast(final_columns, rows, excel_path)
         logger.info(f"Stakeholder Excel written: {excel_path} ({len(videos)} videos)")
     except Exception as e:
         logger.error(f"Failed to write Excel: {e}")
@@ -741,6 +1134,9 @@ def main():
 
     retry_config = RetryConfig.from_settings(settings)
 
+    # One keep-alive connection pool shared by all account and page workers
+    session = create_http_session()
+
     # Checkpoint path
     checkpoint_path = paths['checkpoints'] / "analytics_checkpoint.json"
 
@@ -751,6 +1147,7 @@ def main():
     accounts = config['accounts']['accounts']
     problematic_accounts = settings['windows'].get('problematic_accounts', [])
     overlap_days = settings['windows'].get('incremental_overlap_days', 3)
+    page_concurrency = settings.get('api', {}).get('analytics_page_concurrency', 4)
 
     # Validate --retry-failed requires --account
     if getattr(args, 'retry_failed', False) and not args.account:
@@ -766,7 +1163,13 @@ def main():
         accounts = {args.account: accounts[args.account]}
         logger.info(f"Running for single account: {args.account}")
 
-    for account_name, account_config in accounts.items():
+    retry_failed = getattr(args, 'retry_failed', False)
+
+    # One lifecycle folder for the whole run, even if it crosses a month end
+    year_month = datetime.now().strftime("%Y-%m")
+
+    def _process_one_account(account_name: str, account_config: dict) -> None:
+        """Process one account and write its outputs."""
         account_id = account_config['account_id']
 
         # Determine window type (monthly for problematic accounts)
@@ -787,7 +1190,7 @@ def main():
                 f"CMS metadata not found: {cms_path}. "
                 f"Run 1_cms_metadata.py first."
             )
-            continue
+            return
 
         try:
             # Process account
@@ -802,18 +1205,36 @@ def main():
                 checkpoint=checkpoint,
                 logger=logger,
                 overlap_days=overlap_days,
-                retry_failed=getattr(args, 'retry_failed', False)
+                retry_failed=retry_failed,
+                page_concurrency=page_concurrency,
+                session=session
             )
 
             # Write outputs
             lv_path = paths['analytics'] / f"{account_name}_dt_last_viewed.json"
             enriched_path = paths['analytics'] / f"{account_name}_cms_enriched.json"
+            excel_path = get_lifecycle_excel_path(paths['life_cycle_mgmt'], account_name, year_month)
+
+            # Skip the output stage when neither last_map nor the CMS
+            # metadata changed since the outputs were last written
+            fingerprint = output_fingerprint(last_map, cms_path)
+            with CHECKPOINT_LOCK:
+                previous_fingerprint = checkpoint["accounts"][account_name].get("output_fingerprint")
+
+            if (fingerprint == previous_fingerprint and lv_path.exists()
+                    and enriched_path.exists() and excel_path.exists()):
+                logger.info(f"{account_name}: dt_last_viewed and CMS unchanged, skipping enrichment")
+                return
 
             write_last_viewed_json(last_map, lv_path, logger)
             enriched_videos = enrich_cms_metadata(cms_path, last_map, enriched_path, logger)
 
             # Write Excel for lifecycle management (Harper-compatible format)
-            write_lifecycle_excel(enriched_videos, account_name, paths['life_cycle_mgmt'], logger)
+            write_lifecycle_excel(enriched_videos, account_name, paths['life_cycle_mgmt'], logger, year_month)
+
+            with CHECKPOINT_LOCK:
+                checkpoint["accounts"][account_name]["output_fingerprint"] = fingerprint
+                save_checkpoint_atomic(checkpoint_path, checkpoint)
 
             logger.info(f"Completed {account_name}: {len(last_map)} videos with views")
 
@@ -822,6 +1243,19 @@ def main():
             import traceback
             logger.error(traceback.format_exc())
 
+    # Accounts are independent and their runtime is dominated by blocking
+    # HTTP calls, so run several at once (bounded to respect rate limits)
+    max_workers = max(1, min(settings.get('account_concurrency', 4), len(accounts)))
+    logger.info(f"Processing {len(accounts)} accounts with {max_workers} workers")
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [
+            executor.submit(_process_one_account, account_name, account_config)
+            for account_name, account_config in accounts.items()
+        ]
+        for future in as_completed(futures):
+            future.result()
+
     # Summary
     logger.info("\n" + "=" * 60)
     logger.info("dt_last_viewed calculation completed")
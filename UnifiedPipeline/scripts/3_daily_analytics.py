@@ -47,11 +47,14 @@ Parallel Processing:
 """
 
 import sys
-import json
+import time
 import argparse
+from collections import defaultdict, deque
+from itertools import islice
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 from tqdm import tqdm
 
 # Add scripts directory to path for imports
@@ -65,11 +68,14 @@ from shared import (
     BrightcoveAuthManager,
     RetryConfig,
     robust_api_call,
+    is_last_analytics_page,
+    create_http_session,
     init_analytics_db,
     upsert_daily_analytics,
     get_all_video_max_dates,
     get_db_stats,
     calculate_overlap_start_date,
+    json_loads,
 )
 
 # =============================================================================
@@ -78,6 +84,12 @@ from shared import (
 
 SCRIPT_NAME = "3_daily_analytics"
 
+# Flush buffered rows to DuckDB (and CHECKPOINT) once either limit is hit.
+# Larger batches suit DuckDB's bulk Arrow ingest; the time limit bounds
+# how much work a crash can lose when fetches are slow.
+UPSERT_EVERY_ROWS = 10000
+UPSERT_EVERY_SECONDS = 120
+
 
 # =============================================================================
 # ERROR LOGGING
@@ -109,111 +121,217 @@ def log_api_issue(log_path: Path, account: str, year: int, video_id: str,
 # ANALYTICS API CALLS
 # =============================================================================
 
-def fetch_daily_summary(
-    video_id: str,
+ANALYTICS_URL = "https://analytics.api.brightcove.com/v1/data"
+
+SUMMARY_FIELDS = [
+    "video_view", "video_impression", "play_rate",
+    "engagement_score", "video_engagement_1", "video_engagement_25",
+    "video_engagement_50", "video_engagement_75", "video_engagement_100",
+    "video_percent_viewed", "video_seconds_viewed"
+]
+
+# Device types reported in the views_other column
+OTHER_DEVICE_TYPES = {"other", "tv", "connected_tv"}
+
+
+def fetch_all_items(
+    params: Dict,
+    headers: Dict[str, str],
+    auth_manager: BrightcoveAuthManager,
+    retry_config: RetryConfig,
+    proxies: dict,
+    logger,
+    page_limit: int = 10000,
+    session=None
+) -> Optional[List[Dict]]:
+    """
+    Fetch every item of an analytics query, following offset pagination.
+
+    headers is reused for every page; on a 401 robust_api_call refreshes
+    the token and updates it in place.
+
+    Returns None if any page fails, so callers never see partial data.
+    """
+    items = []
+    offset = 0
+
+    while True:
+        page_params = {**params, "limit": page_limit, "offset": offset}
+
+        response = robust_api_call(
+            url=ANALYTICS_URL,
+            headers=headers,
+            params=page_params,
+            retry_config=retry_config,
+            proxies=proxies,
+            logger=logger,
+            session=session,
+            auth_manager=auth_manager
+        )
+        if not response:
+            return None
+
+        data = response.json()
+        page = data.get("items", [])
+        items.extend(page)
+
+        # Without item_count, keep paging until a short page
+        offset += page_limit
+        if is_last_analytics_page(data, len(page), offset, page_limit):
+            return items
+
+
+def fetch_daily_summary_batch(
+    video_ids: List[str],
     account_id: str,
     from_date: str,
     to_date: str,
+    headers: Dict[str, str],
     auth_manager: BrightcoveAuthManager,
     retry_config: RetryConfig,
     proxies: dict,
-    logger
-) -> List[Dict]:
+    logger,
+    page_limit: int = 10000,
+    session=None
+) -> Optional[Dict[str, List[Dict]]]:
     """
-    Fetch daily summary metrics for a video.
+    Fetch daily summary metrics for several videos in one query.
 
-    Returns list of daily records with metrics.
+    Returns dict: {video_id: [daily records sorted by date]}, or None if
+    the request failed. Videos without data are absent from the dict.
     """
-    url = "https://analytics.api.brightcove.com/v1/data"
-
     params = {
         "accounts": account_id,
-        "dimensions": "date",
-        "where": f"video=={video_id}",
-        "fields": ",".join([
-            "video_view", "video_impression", "play_rate",
-            "engagement_score", "video_engagement_1", "video_engagement_25",
-            "video_engagement_50", "video_engagement_75", "video_engagement_100",
-            "video_percent_viewed", "video_seconds_viewed"
-        ]),
+        "dimensions": "date,video",
+        "where": f"video=={','.join(video_ids)}",
+        "fields": ",".join(SUMMARY_FIELDS),
         "from": from_date,
         "to": to_date,
-        "limit": 366,  # Max one year of daily data
         "sort": "date"
     }
 
-    headers = {"Authorization": f"Bearer {auth_manager.get_token()}"}
+    items = fetch_all_items(params, headers, auth_manager, retry_config, proxies, logger,
+                            page_limit, session)
+    if items is None:
+        return None
 
-    response = robust_api_call(
-        url=url,
-        headers=headers,
-        params=params,
-        retry_config=retry_config,
-        proxies=proxies,
-        logger=logger
-    )
+    # Group by video (items arrive sorted by date)
+    by_video = defaultdict(list)
+    for item in items:
+        by_video[str(item.get("video"))].append(item)
 
-    if response:
-        return response.json().get("items", [])
-    return []
+    return dict(by_video)
 
 
-def fetch_daily_device_breakdown(
-    video_id: str,
+def fetch_daily_device_breakdown_batch(
+    video_ids: List[str],
     account_id: str,
     from_date: str,
     to_date: str,
+    headers: Dict[str, str],
     auth_manager: BrightcoveAuthManager,
     retry_config: RetryConfig,
     proxies: dict,
-    logger
-) -> Dict[str, Dict[str, int]]:
+    logger,
+    page_limit: int = 10000,
+    session=None
+) -> Dict[str, Dict[str, Dict[str, int]]]:
     """
-    Fetch device breakdown per date for a video.
+    Fetch device breakdown per date for several videos in one query.
 
-    Returns dict: {date: {device_type: views}}
+    Returns dict: {video_id: {date: {device_type: views}}}
     """
-    url = "https://analytics.api.brightcove.com/v1/data"
-
     params = {
         "accounts": account_id,
-        "dimensions": "date,device_type",
-        "where": f"video=={video_id}",
+        "dimensions": "date,video,device_type",
+        "where": f"video=={','.join(video_ids)}",
         "fields": "video_view",
         "from": from_date,
         "to": to_date,
-        "limit": 2000,  # Date * device types
         "sort": "date"
     }
 
-    headers = {"Authorization": f"Bearer {auth_manager.get_token()}"}
-
-    response = robust_api_call(
-        url=url,
-        headers=headers,
-        params=params,
-        retry_config=retry_config,
-        proxies=proxies,
-        logger=logger
-    )
-
-    if not response:
+    items = fetch_all_items(params, headers, auth_manager, retry_config, proxies, logger,
+                            page_limit, session)
+    if not items:
         return {}
 
-    items = response.json().get("items", [])
-
-    # Group by date
-    by_date = {}
+    # Group by video, then date. TV devices are folded into "other" here
+    # so the merge step reads one key per device column.
+    by_video = defaultdict(lambda: defaultdict(dict))
     for item in items:
-        date = item.get("date")
         device = item.get("device_type", "other").lower()
-        views = item.get("video_view", 0)
+        if device in OTHER_DEVICE_TYPES:
+            device = "other"
+        devices = by_video[str(item.get("video"))][item.get("date")]
+        devices[device] = devices.get(device, 0) + item.get("video_view", 0)
 
-        if date not in by_date:
-            by_date[date] = {}
-        by_date[date][device] = views
+    return {video_id: dict(by_date) for video_id, by_date in by_video.items()}
 
-    return by_date
+
+def fetch_video_analytics_batch(
+    video_ids: List[str],
+    account_id: str,
+    from_date: str,
+    to_date: str,
+    auth_manager: BrightcoveAuthManager,
+    retry_config: RetryConfig,
+    proxies: dict,
+    logger,
+    page_limit: int = 10000,
+    session=None
+) -> Dict[str, Tuple[List[Dict], Dict[str, Dict[str, int]]]]:
+    """
+    Fetch daily summary and device breakdown for a batch of videos.
+
+    All videos share the same date range. The device breakdown is only
+    requested for videos whose summary has views (its columns would all
+    be 0 otherwise). Safe to call from worker threads.
+
+    Returns dict: {video_id: (summary_items, device_by_date)} with an
+    empty summary for videos without data (or when the request failed).
+    """
+    # One token lookup per batch; both queries and all pages share it
+    headers = {"Authorization": f"Bearer {auth_manager.get_token()}"}
+
+    summaries = fetch_daily_summary_batch(
+        video_ids=video_ids,
+        account_id=account_id,
+        from_date=from_date,
+        to_date=to_date,
+        headers=headers,
+        auth_manager=auth_manager,
+        retry_config=retry_config,
+        proxies=proxies,
+        logger=logger,
+        page_limit=page_limit,
+        session=session
+    ) or {}
+
+    with_views = [
+        vid for vid in video_ids
+        if any(item.get("video_view") for item in summaries.get(vid, ()))
+    ]
+    devices = {}
+    if with_views:
+        devices = fetch_daily_device_breakdown_batch(
+            video_ids=with_views,
+            account_id=account_id,
+            from_date=from_date,
+            to_date=to_date,
+            headers=headers,
+            auth_manager=auth_manager,
+            retry_config=retry_config,
+            proxies=proxies,
+            logger=logger,
+            page_limit=page_limit,
+            session=session
+        )
+
+    return {
+        vid: (summaries.get(vid, []), devices.get(vid, {}))
+        for vid in video_ids
+    }
 
 
 # =============================================================================
@@ -298,7 +416,7 @@ def merge_analytics_with_metadata(
             "views_desktop": devices.get("desktop", 0),
             "views_mobile": devices.get("mobile", 0),
             "views_tablet": devices.get("tablet", 0),
-            "views_other": devices.get("other", 0) + devices.get("tv", 0) + devices.get("connected_tv", 0),
+            "views_other": devices.get("other", 0),
             # Meta
             "report_generated_on": report_timestamp,
             "data_type": data_type,
@@ -313,34 +431,60 @@ def merge_analytics_with_metadata(
 # YEAR PROCESSING
 # =============================================================================
 
+def load_cms_videos(accounts: Dict, paths: Dict, logger) -> Dict[str, List[Dict]]:
+    """
+    Load each account's enriched CMS once for the whole run.
+
+    Accounts whose {account}_cms_enriched.json is missing are left out
+    (with a warning), so process_year skips them for every year.
+    """
+    videos_by_account = {}
+    for account_name in accounts:
+        cms_path = paths['analytics'] / f"{account_name}_cms_enriched.json"
+        if not cms_path.exists():
+            logger.warning(f"CMS not found: {cms_path}. Skipping.")
+            continue
+        videos_by_account[account_name] = json_loads(cms_path.read_bytes())
+    return videos_by_account
+
+
 def process_year(
     year: int,
     accounts: Dict,
     auth_manager: BrightcoveAuthManager,
     retry_config: RetryConfig,
     proxies: dict,
-    paths: Dict,
+    videos_by_account: Dict[str, List[Dict]],
     conn,
     video_max_dates: Dict,
     overlap_days: int,
     logger,
-    error_log_path: Optional[Path] = None
+    error_log_path: Optional[Path] = None,
+    video_concurrency: int = 1,
+    video_batch_size: int = 1,
+    page_limit: int = 10000,
+    session=None
 ) -> int:
     """
     Process a single year for all accounts.
 
     Uses overlap-based incremental fetching to handle Brightcove lag.
+    Videos with the same start date are queried video_batch_size at a
+    time, with up to video_concurrency batches in flight.
 
     Returns total rows written.
     """
-    report_timestamp = datetime.now().isoformat()
+    # One clock reading per year: all rows share the report timestamp and
+    # the date cutoffs agree with it
+    now = datetime.now()
+    report_timestamp = now.isoformat()
     total_rows = 0
 
     # Date range for year
     year_start = f"{year}-01-01"
     year_end = f"{year}-12-31"
-    today = datetime.now().strftime("%Y-%m-%d")
-    current_year = datetime.now().year
+    today = now.strftime("%Y-%m-%d")
+    current_year = now.year
 
     # For current year, don't go past today
     if year == current_year:
@@ -355,90 +499,97 @@ def process_year(
 
     # Current year optimization: skip videos not viewed in last 90 days
     # These dormant videos are unlikely to get new views, reducing API calls
-    dormant_cutoff = (datetime.now() - timedelta(days=90)).strftime("%Y-%m-%d")
+    dormant_cutoff = (now - timedelta(days=90)).strftime("%Y-%m-%d")
     if not is_historical_year:
         logger.info(f"Current year mode: videos with dt_last_viewed < {dormant_cutoff} will be skipped")
+    last_viewed_cutoff = year_start if is_historical_year else dormant_cutoff
 
     for account_name, account_config in accounts.items():
         account_id = account_config['account_id']
+        account_key = str(account_id)  # DuckDB keys are strings
 
         logger.info(f"\n{'='*60}")
         logger.info(f"Processing: {account_name} {year}")
         logger.info(f"{'='*60}")
 
-        # Load CMS data
-        cms_path = paths['analytics'] / f"{account_name}_cms_enriched.json"
-        if not cms_path.exists():
-            logger.warning(f"CMS not found: {cms_path}. Skipping.")
+        # CMS data (loaded once in main; missing CMS files were already reported)
+        videos = videos_by_account.get(account_name)
+        if videos is None:
             continue
 
-        with open(cms_path, 'r', encoding='utf-8') as f:
-            videos = json.load(f)
-
         logger.info(f"Processing {len(videos)} videos for {year_start} to {year_end}")
 
-        # Count how many videos in video_max_dates match this account
-        account_videos_in_db = sum(1 for (acc_id, vid_id) in video_max_dates.keys() if acc_id == str(account_id))
-        logger.info(f"Videos in video_max_dates for {account_name}: {account_videos_in_db}")
+        # This account's slice of video_max_dates, keyed by video_id alone
+        account_max_dates = {
+            vid_id: max_date
+            for (acc_id, vid_id), max_date in video_max_dates.items()
+            if acc_id == account_key
+        }
+        logger.info(f"Videos in video_max_dates for {account_name}: {len(account_max_dates)}")
 
-        # PRE-LOOP ANALYSIS: Count what will be skipped/processed
+        # PRE-LOOP ANALYSIS: classify every video once. Skipped videos are
+        # only counted; the fetch loop below visits just the videos that
+        # need API calls, with their start date already resolved.
         logger.info("Analyzing videos before processing...")
         will_skip_created_after = 0
         will_skip_no_views = 0
         will_skip_dormant = 0
         will_skip_has_data = 0
-        will_process = 0
         found_in_duckdb = 0
         not_in_duckdb = 0
+        to_fetch = []  # (video, video_id, start_date)
 
         for video in videos:
-            video_id = str(video.get("id"))
-            key = (str(account_id), video_id)
+            video_id = str(video.get("id"))  # Convert to string to match DuckDB keys
 
-            # Check created_at
+            # Skip videos created after this year - they can't have historical data
             created_at = video.get("created_at", "")
             if created_at:
+                # Extract just the date part (YYYY-MM-DD) from ISO timestamp
                 created_date = created_at[:10] if len(created_at) >= 10 else ""
                 if created_date > year_end:
                     will_skip_created_after += 1
                     continue
 
-            # For historical years: skip if dt_last_viewed < year_start
-            # These videos had no views in this year, so no data to fetch
-            if is_historical_year:
-                dt_last_viewed = video.get("dt_last_viewed", "")
-                if dt_last_viewed:
-                    last_viewed_date = dt_last_viewed[:10] if len(dt_last_viewed) >= 10 else ""
-                    if last_viewed_date and last_viewed_date < year_start:
+            # Historical years: skip if dt_last_viewed < year_start (no views
+            # in this year, so no data to fetch).
+            # Current year: skip if dt_last_viewed < 90 days ago (dormant)
+            dt_last_viewed = video.get("dt_last_viewed", "")
+            if dt_last_viewed:
+                last_viewed_date = dt_last_viewed[:10] if len(dt_last_viewed) >= 10 else ""
+                if last_viewed_date and last_viewed_date < last_viewed_cutoff:
+                    if is_historical_year:
                         will_skip_no_views += 1
-                        continue
-            else:
-                # For current year: skip if dt_last_viewed < 90 days ago (dormant)
-                dt_last_viewed = video.get("dt_last_viewed", "")
-                if dt_last_viewed:
-                    last_viewed_date = dt_last_viewed[:10] if len(dt_last_viewed) >= 10 else ""
-                    if last_viewed_date and last_viewed_date < dormant_cutoff:
+                    else:
                         will_skip_dormant += 1
-                        continue
+                    continue
 
-            # Check if has data in DuckDB
-            last_processed = video_max_dates.get(key)
+            # Get last processed date for this video
+            last_processed = account_max_dates.get(video_id)
+
+            # For historical years: ANY data = complete (skip)
+            # For current year: use overlap logic
             if last_processed:
                 found_in_duckdb += 1
-                # For historical years: ANY data = complete (skip)
-                # For current year: use overlap logic
                 if is_historical_year:
                     will_skip_has_data += 1
                     continue
-                else:
-                    start_date = calculate_overlap_start_date(last_processed, year_start, overlap_days)
-                    if start_date > year_end or last_processed >= year_end:
-                        will_skip_has_data += 1
-                        continue
+                start_date = calculate_overlap_start_date(
+                    last_processed_date=last_processed,
+                    year_start=year_start,
+                    overlap_days=overlap_days
+                )
+                if start_date > year_end or last_processed >= year_end:
+                    will_skip_has_data += 1
+                    continue
             else:
                 not_in_duckdb += 1
+                # No data for this year - start from beginning
+                start_date = year_start
 
-            will_process += 1
+            to_fetch.append((video, video_id, start_date))
+
+        will_process = len(to_fetch)
 
         logger.info(f"  Videos created after {year_end}: {will_skip_created_after} (will skip)")
         if is_historical_year:
@@ -450,150 +601,136 @@ def process_year(
         skip_reason = "any data (historical)" if is_historical_year else "complete data"
         logger.info(f"  Videos with {skip_reason}: {will_skip_has_data} (will skip)")
         logger.info(f"  Videos needing API calls: {will_process}")
-        logger.info(f"  Estimated time: ~{will_process * 2.5 / 60:.1f} minutes (assuming 2.5s per API call)")
 
-        if will_process > 500:
-            logger.warning(f"  This will make {will_process} API calls - consider if this is expected!")
+        # Videos sharing a start date are fetched together, up to
+        # video_batch_size per request
+        by_start_date = {}
+        for item in to_fetch:
+            by_start_date.setdefault(item[2], []).append(item)
+        batches = [
+            group[i:i + video_batch_size]
+            for group in by_start_date.values()
+            for i in range(0, len(group), video_batch_size)
+        ]
+
+        logger.info(f"  Batch requests: {len(batches)} (up to {video_batch_size} videos each)")
+        logger.info(
+            f"  Estimated time: ~{len(batches) * 2.5 / video_concurrency / 60:.1f} minutes "
+            f"(assuming 2.5s per request, {video_concurrency} in flight)"
+        )
 
-        # Sanity check
-        if found_in_duckdb < will_skip_has_data:
-            logger.error(f"  ERROR: Found {found_in_duckdb} in DuckDB but skipping {will_skip_has_data} - logic error!")
+        if len(batches) > 500:
+            logger.warning(f"  This will make {len(batches)} batch requests - consider if this is expected!")
 
         rows_written = 0
         batch_rows = []
-        batch_size = 100  # Commit every N videos
-
-        # Skip counters for diagnostics
-        skip_created_after = 0
-        skip_no_views = 0
-        skip_dormant = 0
-        skip_already_complete = 0
-        api_calls_made = 0
-        api_empty_responses = 0
-        api_errors = 0
+        last_upsert_ts = time.time()
 
-        for video in tqdm(videos, desc=f"{account_name} {year}"):
-            video_id = str(video.get("id"))  # Convert to string to match DuckDB keys
-            key = (str(account_id), video_id)
+        # Per-video counters for diagnostics (one batch request covers
+        # up to video_batch_size videos)
+        videos_fetched = 0
+        videos_empty = 0
+        api_errors = 0
 
-            # Skip videos created after this year - they can't have historical data
-            created_at = video.get("created_at", "")
-            if created_at:
-                # Extract just the date part (YYYY-MM-DD) from ISO timestamp
-                created_date = created_at[:10] if len(created_at) >= 10 else ""
-                if created_date > year_end:
-                    skip_created_after += 1
-                    continue  # Video didn't exist in this year
-
-            # For historical years: skip if dt_last_viewed < year_start
-            # These videos had no views in this year, so no data to fetch
-            if is_historical_year:
-                dt_last_viewed = video.get("dt_last_viewed", "")
-                if dt_last_viewed:
-                    last_viewed_date = dt_last_viewed[:10] if len(dt_last_viewed) >= 10 else ""
-                    if last_viewed_date and last_viewed_date < year_start:
-                        skip_no_views += 1
-                        continue
-            else:
-                # For current year: skip if dt_last_viewed < 90 days ago (dormant)
-                dt_last_viewed = video.get("dt_last_viewed", "")
-                if dt_last_viewed:
-                    last_viewed_date = dt_last_viewed[:10] if len(dt_last_viewed) >= 10 else ""
-                    if last_viewed_date and last_viewed_date < dormant_cutoff:
-                        skip_dormant += 1
+        def submit_batch(batch):
+            return executor.submit(
+                fetch_video_analytics_batch,
+                video_ids=[video_id for _, video_id, _ in batch],
+                account_id=account_id,
+                from_date=batch[0][2],
+                to_date=year_end,
+                auth_manager=auth_manager,
+                retry_config=retry_config,
+                proxies=proxies,
+                logger=logger,
+                page_limit=page_limit,
+                session=session
+            )
+
+        # Fetch batches concurrently; results are consumed in submission order
+        # so merging, DuckDB writes and error logging stay on this thread.
+        # At most video_concurrency * 2 batches are submitted ahead of the
+        # one being consumed, so fetched results never pile up in memory.
+        executor = ThreadPoolExecutor(max_workers=video_concurrency)
+        try:
+            remaining_batches = iter(batches)
+            pending = deque(
+                (batch, submit_batch(batch))
+                for batch in islice(remaining_batches, video_concurrency * 2)
+            )
+
+            progress = tqdm(total=len(to_fetch), desc=f"{account_name} {year}")
+            while pending:
+                batch, future = pending.popleft()
+                next_batch = next(remaining_batches, None)
+                if next_batch is not None:
+                    pending.append((next_batch, submit_batch(next_batch)))
+
+                try:
+                    results = future.result()
+                    batch_error = None
+                except Exception as e:
+                    results = {}
+                    batch_error = e
+
+                for video, video_id, start_date in batch:
+                    videos_fetched += 1
+
+                    try:
+                        # A failed batch request is reported against each of its videos
+                        if batch_error is not None:
+                            raise batch_error
+
+                        summary, device_breakdown = results[video_id]
+
+                        if not summary:
+                            videos_empty += 1
+                            if error_log_path:
+                                log_api_issue(error_log_path, account_name, year, video_id,
+                                              "empty_response", f"from={start_date} to={year_end}")
+                            continue
+
+                        # Extract metadata
+                        metadata = extract_video_metadata(video, account_name)
+                        metadata["account_id"] = account_id
+
+                        # Merge and collect rows
+                        rows = merge_analytics_with_metadata(
+                            summary, device_breakdown, metadata,
+                            report_timestamp, f"year_{year}"
+                        )
+
+                        batch_rows.extend(rows)
+                        rows_written += len(rows)
+
+                        # Update max date for this video (summary items are
+                        # requested with sort=date, so the last row is the latest)
+                        if rows:
+                            video_max_dates[(account_key, video_id)] = rows[-1]["date"]
+
+                        # Batch commit with periodic checkpoint
+                        if batch_rows and (len(batch_rows) >= UPSERT_EVERY_ROWS or
+                                           time.time() - last_upsert_ts > UPSERT_EVERY_SECONDS):
+                            upsert_daily_analytics(conn, batch_rows, logger)
+                            batch_rows = []
+                            last_upsert_ts = time.time()
+                            # Periodic checkpoint to merge WAL into main DB
+                            conn.execute("CHECKPOINT")
+                            logger.debug("Checkpointed WAL to main DB")
+
+                    except Exception as e:
+                        api_errors += 1
+                        logger.warning(f"Failed video {video_id}: {e}")
+                        if error_log_path:
+                            log_api_issue(error_log_path, account_name, year, video_id,
+                                          "error", str(e))
                         continue
 
-            # Get last processed date for this video
-            last_processed = video_max_dates.get(key)
-
-            # For historical years: ANY data = complete (skip)
-            # For current year: use overlap logic
-            if last_processed:
-                if is_historical_year:
-                    # Historical year: skip if has ANY data for this year
-                    skip_already_complete += 1
-                    continue
-                else:
-                    # Current year: use overlap logic
-                    start_date = calculate_overlap_start_date(
-                        last_processed_date=last_processed,
-                        year_start=year_start,
-                        overlap_days=overlap_days
-                    )
-                    if start_date > year_end or last_processed >= year_end:
-                        skip_already_complete += 1
-                        continue
-            else:
-                # No data for this year - start from beginning
-                start_date = year_start
-
-            # If we reach here, we're making an API call
-            api_calls_made += 1
-
-            try:
-                # Fetch analytics
-                summary = fetch_daily_summary(
-                    video_id=video_id,
-                    account_id=account_id,
-                    from_date=start_date,
-                    to_date=year_end,
-                    auth_manager=auth_manager,
-                    retry_config=retry_config,
-                    proxies=proxies,
-                    logger=logger
-                )
-
-                if not summary:
-                    api_empty_responses += 1
-                    if error_log_path:
-                        log_api_issue(error_log_path, account_name, year, video_id,
-                                      "empty_response", f"from={start_date} to={year_end}")
-                    continue
-
-                device_breakdown = fetch_daily_device_breakdown(
-                    video_id=video_id,
-                    account_id=account_id,
-                    from_date=start_date,
-                    to_date=year_end,
-                    auth_manager=auth_manager,
-                    retry_config=retry_config,
-                    proxies=proxies,
-                    logger=logger
-                )
-
-                # Extract metadata
-                metadata = extract_video_metadata(video, account_name)
-                metadata["account_id"] = account_id
-
-                # Merge and collect rows
-                rows = merge_analytics_with_metadata(
-                    summary, device_breakdown, metadata,
-                    report_timestamp, f"year_{year}"
-                )
-
-                batch_rows.extend(rows)
-                rows_written += len(rows)
-
-                # Update max date for this video
-                if rows:
-                    max_date = max(r["date"] for r in rows)
-                    video_max_dates[key] = max_date
-
-                # Batch commit with periodic checkpoint
-                if len(batch_rows) >= batch_size * 30:  # ~30 days per video avg
-                    upsert_daily_analytics(conn, batch_rows, logger)
-                    batch_rows = []
-                    # Periodic checkpoint to merge WAL into main DB
-                    conn.execute("CHECKPOINT")
-                    logger.debug("Checkpointed WAL to main DB")
-
-            except Exception as e:
-                api_errors += 1
-                logger.warning(f"Failed video {video_id}: {e}")
-                if error_log_path:
-                    log_api_issue(error_log_path, account_name, year, video_id,
-                                  "error", str(e))
-                continue
+                progress.update(len(batch))
+            progress.close()
+        finally:
+            # Drop queued fetches if the loop stops early (e.g. Ctrl+C)
+            executor.shutdown(wait=True, cancel_futures=True)
 
         # Final batch commit
         if batch_rows:
@@ -605,12 +742,12 @@ def process_year(
 
         total_rows += rows_written
         logger.info(f"Completed {account_name} {year}: {rows_written} rows")
-        logger.info(f"  Skip stats: created_after={skip_created_after}, no_views={skip_no_views}, dormant={skip_dormant}, already_complete={skip_already_complete}")
-        logger.info(f"  API stats: calls={api_calls_made}, empty_responses={api_empty_responses}, errors={api_errors}")
+        logger.info(f"  Skip stats: created_after={will_skip_created_after}, no_views={will_skip_no_views}, dormant={will_skip_dormant}, already_complete={will_skip_has_data}")
+        logger.info(f"  API stats: batch_requests={len(batches)}, videos={videos_fetched}, empty_videos={videos_empty}, errors={api_errors}")
 
-        # Warn if ALL API calls returned empty - likely indicates a problem
-        if api_calls_made > 0 and api_empty_responses == api_calls_made:
-            logger.warning(f"  WARNING: ALL {api_calls_made} API calls returned empty data! Check auth/API status.")
+        # Warn if ALL videos came back empty - likely indicates a problem
+        if videos_fetched > 0 and videos_empty == videos_fetched:
+            logger.warning(f"  WARNING: ALL {videos_fetched} videos returned empty data! Check auth/API status.")
 
     return total_rows
 
@@ -731,6 +868,9 @@ def main():
     historical_years = analytics_settings.get('historical_years', [2024, 2025])
     current_year = analytics_settings.get('current_year', 2026)
     overlap_days = analytics_settings.get('overlap_days', 7)
+    video_concurrency = max(1, analytics_settings.get('video_concurrency', 8))
+    video_batch_size = max(1, analytics_settings.get('video_batch_size', 20))
+    page_limit = settings['api'].get('analytics_page_limit', 10000)
 
     # Combine all years
     all_years = sorted(set(historical_years + [current_year]))
@@ -741,6 +881,7 @@ def main():
 
     logger.info(f"Years to process: {all_years}")
     logger.info(f"Overlap days for lag compensation: {overlap_days}")
+    logger.info(f"Concurrent requests: {video_concurrency}, videos per request: {video_batch_size}")
 
     # Setup authentication
     proxies = secrets.get('proxies') if settings['proxy']['enabled'] else None
@@ -751,6 +892,8 @@ def main():
     )
 
     retry_config = RetryConfig.from_settings(settings)
+    # One connection pool for the whole run, sized for the concurrent batches
+    session = create_http_session(pool_size=video_concurrency)
     all_accounts = config['accounts']['accounts']
 
     # Filter to single account if --account is specified
@@ -779,6 +922,9 @@ def main():
     error_log_path = init_error_log(paths['output'], single_account if single_account_mode else None)
     logger.info(f"Error log: {error_log_path.name}")
 
+    # Parse each account's CMS once rather than once per year
+    videos_by_account = load_cms_videos(accounts, paths, logger)
+
     # Process each year
     total_rows = 0
     for year in all_years:
@@ -798,12 +944,16 @@ def main():
             auth_manager=auth_manager,
             retry_config=retry_config,
             proxies=proxies,
-            paths=paths,
+            videos_by_account=videos_by_account,
             conn=conn,
             video_max_dates=video_max_dates,
             overlap_days=overlap_days,
             logger=logger,
-            error_log_path=error_log_path
+            error_log_path=error_log_path,
+            video_concurrency=video_concurrency,
+            video_batch_size=video_batch_size,
+            page_limit=page_limit,
+            session=session
         )
         total_rows += year_rows
 
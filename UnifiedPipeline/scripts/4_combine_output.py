@@ -9,9 +9,11 @@ Runtime: ~1-3 minutes
 
 Features:
     - Reads directly from DuckDB (output/analytics.duckdb)
+    - DuckDB writes each CSV itself (COPY); rows never pass through Python
     - Generates separate CSVs by category and by year
     - Proper column ordering matching Reporting + Harper fields
     - Supports --account flag for account-specific DuckDB files
+    - Optional --gzip flag writes gzip-compressed .csv.gz files
 
 Input:
     - output/analytics.duckdb (from script 3)
@@ -27,11 +29,9 @@ Output:
 """
 
 import sys
-import csv
 import argparse
 from pathlib import Path
-from datetime import datetime
-from typing import Dict, List
+from typing import Dict, Optional
 from collections import defaultdict
 
 # Add scripts directory to path for imports
@@ -83,39 +83,95 @@ OUTPUT_FIELDS = [
 # CSV GENERATION
 # =============================================================================
 
-def write_csv(rows: List[Dict], output_path: Path, logger) -> int:
+def create_output_rows(conn, channel_to_category: Dict[str, str]) -> None:
     """
-    Write rows to CSV file.
+    Create the temp table csv_rows: daily_analytics rows in output column
+    order, plus their year and category, sorted by account_id, video_id, date.
 
-    Returns number of rows written.
+    The join and sort run once here; every output file is then a filtered
+    scan of csv_rows, which keeps the stored order.
+
+    Channels without a configured category are grouped as "other".
+    Empty VARCHAR values are exported as NULL so they are written as empty
+    fields, like NULLs, rather than as a quoted "".
+    """
+    conn.execute("CREATE OR REPLACE TEMP TABLE channel_category (channel VARCHAR, category VARCHAR)")
+    if channel_to_category:
+        conn.executemany(
+            "INSERT INTO channel_category VALUES (?, ?)",
+            list(channel_to_category.items())
+        )
+
+    column_types = dict(conn.execute("""
+        SELECT column_name, data_type
+        FROM information_schema.columns
+        WHERE table_name = 'daily_analytics'
+    """).fetchall())
+
+    select_list = []
+    for field in OUTPUT_FIELDS:
+        if column_types.get(field) == "VARCHAR":
+            select_list.append(f"NULLIF(d.{field}, '') AS {field}")
+        else:
+            select_list.append(f"d.{field}")
+
+    conn.execute(f"""
+        CREATE OR REPLACE TEMP TABLE csv_rows AS
+        SELECT
+            {", ".join(select_list)},
+            CAST(year(d.date) AS VARCHAR) AS year,
+            COALESCE(c.category, 'other') AS category
+        FROM daily_analytics d
+        LEFT JOIN channel_category c ON d.channel = c.channel
+        ORDER BY d.account_id, d.video_id, d.date
+    """)
+
+
+def sql_string(value: str) -> str:
+    """Quote a value as a SQL string literal."""
+    return "'" + str(value).replace("'", "''") + "'"
+
+
+def write_csv(
+    conn,
+    output_path: Path,
+    logger,
+    year: Optional[str] = None,
+    category: Optional[str] = None,
+    compress: bool = False
+) -> int:
     """
-    if not rows:
-        logger.info(f"No rows to write for {output_path.name}")
-        return 0
+    Write csv_rows (optionally one year and/or category) to a CSV file.
 
-    output_path.parent.mkdir(parents=True, exist_ok=True)
+    DuckDB streams the rows straight to disk in csv_rows order
+    (account_id, video_id, date). Only called for groups that have rows.
+    With compress, the file is gzipped and ".gz" appended to its name.
 
-    with open(output_path, 'w', newline='', encoding='utf-8') as f:
-        writer = csv.DictWriter(f, fieldnames=OUTPUT_FIELDS, extrasaction='ignore')
-        writer.writeheader()
+    Returns number of rows written.
+    """
+    conditions = ["TRUE"]
+    if year is not None:
+        conditions.append(f"year = {sql_string(year)}")
+    if category is not None:
+        conditions.append(f"category = {sql_string(category)}")
 
-        for row in rows:
-            # Ensure all fields exist
-            clean_row = {field: row.get(field, "") for field in OUTPUT_FIELDS}
-            writer.writerow(clean_row)
+    options = "FORMAT CSV, HEADER, NEW_LINE '\r\n'"
+    if compress:
+        output_path = output_path.with_name(output_path.name + ".gz")
+        options += ", COMPRESSION GZIP"
 
-    logger.info(f"Written {len(rows)} rows to {output_path}")
-    return len(rows)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
 
+    row_count = conn.execute(f"""
+        COPY (
+            SELECT {", ".join(OUTPUT_FIELDS)}
+            FROM csv_rows
+            WHERE {" AND ".join(conditions)}
+        ) TO {sql_string(output_path)} ({options})
+    """).fetchone()[0]
 
-def extract_year_from_date(date_val) -> str:
-    """Extract year from date value (string or date object)."""
-    if not date_val:
-        return "unknown"
-    date_str = str(date_val)
-    if len(date_str) >= 4:
-        return date_str[:4]
-    return "unknown"
+    logger.info(f"Written {row_count} rows to {output_path}")
+    return row_count
 
 
 # =============================================================================
@@ -139,6 +195,7 @@ Output:
     - output/daily/daily_analytics_YYYY_all.csv (per year)
     - output/daily/daily_analytics_YYYY_{category}.csv (per category)
     - output/daily/daily_analytics_combined_all.csv
+    - With --gzip, the same files as .csv.gz
         """
     )
     parser.add_argument(
@@ -146,6 +203,11 @@ Output:
         type=str,
         help='Use account-specific DuckDB file (analytics_{account}.duckdb)'
     )
+    parser.add_argument(
+        '--gzip',
+        action='store_true',
+        help='Write gzip-compressed .csv.gz files instead of plain CSV'
+    )
     return parser.parse_args()
 
 
@@ -199,55 +261,41 @@ def main():
         conn.close()
         return
 
-    # Load all rows from DuckDB
-    logger.info("\nLoading data from DuckDB...")
-    result = conn.execute("""
-        SELECT * FROM daily_analytics
-        ORDER BY account_id, video_id, date
-    """).fetchdf()
+    create_output_rows(conn, channel_to_category)
 
-    conn.close()
+    # Row counts per year and category
+    groups = conn.execute("""
+        SELECT year, category, COUNT(*) AS row_count
+        FROM csv_rows
+        GROUP BY year, category
+        ORDER BY year, category
+    """).fetchall()
 
-    # Convert DataFrame to list of dicts for CSV writing
-    all_rows = result.to_dict('records')
+    rows_by_year = defaultdict(int)
+    rows_by_year_category = defaultdict(dict)
+    rows_by_category = defaultdict(int)
+    for year, category, row_count in groups:
+        rows_by_year[year] += row_count
+        rows_by_year_category[year][category] = row_count
+        rows_by_category[category] += row_count
+    total_rows = sum(rows_by_year.values())
 
-    # Convert date objects to strings for CSV output
-    for row in all_rows:
-        if row.get("date") is not None:
-            row["date"] = str(row["date"])[:10]  # YYYY-MM-DD
-
-    logger.info(f"Total rows: {len(all_rows)}")
-
-    # Group rows by year and category
-    rows_by_year = defaultdict(list)
-    rows_by_year_category = defaultdict(lambda: defaultdict(list))
-
-    for row in all_rows:
-        date = row.get("date", "")
-        year = extract_year_from_date(date)
-        channel = row.get("channel", "")
-        category = channel_to_category.get(channel, "other")
-
-        rows_by_year[year].append(row)
-        rows_by_year_category[year][category].append(row)
+    logger.info(f"Total rows: {total_rows}")
 
     output_dir = paths['daily']
 
     # Write per-year files
     logger.info("\n--- Per-Year Output Files ---")
     for year in sorted(rows_by_year.keys()):
-        year_rows = rows_by_year[year]
-
         # All channels for this year
         output_path = output_dir / f"daily_analytics_{year}_all.csv"
-        write_csv(year_rows, output_path, logger)
+        write_csv(conn, output_path, logger, year=year, compress=args.gzip)
 
         # Per-category for this year
         for category_name in sorted(rows_by_year_category[year].keys()):
-            cat_rows = rows_by_year_category[year][category_name]
-            if cat_rows:
-                output_path = output_dir / f"daily_analytics_{year}_{category_name}.csv"
-                write_csv(cat_rows, output_path, logger)
+            output_path = output_dir / f"daily_analytics_{year}_{category_name}.csv"
+            write_csv(conn, output_path, logger, year=year, category=category_name,
+                      compress=args.gzip)
 
     # Write combined file (all years)
     logger.info("\n--- Combined Output Files ---")
@@ -255,20 +303,22 @@ def main():
 
     # All data combined
     output_path = output_dir / f"daily_analytics_{years_str}_all.csv"
-    write_csv(all_rows, output_path, logger)
+    write_csv(conn, output_path, logger, compress=args.gzip)
 
     # Per-category combined
-    rows_by_category = defaultdict(list)
-    for row in all_rows:
-        channel = row.get("channel", "")
-        category = channel_to_category.get(channel, "other")
-        rows_by_category[category].append(row)
-
     for category_name in sorted(rows_by_category.keys()):
-        cat_rows = rows_by_category[category_name]
-        if cat_rows:
-            output_path = output_dir / f"daily_analytics_{years_str}_{category_name}.csv"
-            write_csv(cat_rows, output_path, logger)
+        output_path = output_dir / f"daily_analytics_{years_str}_{category_name}.csv"
+        write_csv(conn, output_path, logger, category=category_name, compress=args.gzip)
+
+    # Channels per category for the summary
+    channels_by_category = defaultdict(list)
+    for category, channel in conn.execute("""
+        SELECT DISTINCT category, channel FROM csv_rows ORDER BY channel
+    """).fetchall():
+        if channel:
+            channels_by_category[category].append(channel)
+
+    conn.close()
 
     # Summary
     logger.info("\n" + "=" * 60)
@@ -277,16 +327,16 @@ def main():
 
     logger.info("\nSummary by year:")
     for year in sorted(rows_by_year.keys()):
-        count = len(rows_by_year[year])
+        count = rows_by_year[year]
         logger.info(f"  {year}: {count:,} rows")
 
     logger.info("\nSummary by category:")
     for category in sorted(rows_by_category.keys()):
-        count = len(rows_by_category[category])
-        channels = set(r.get("channel") for r in rows_by_category[category])
-        logger.info(f"  {category}: {count:,} rows ({', '.join(sorted(filter(None, channels)))})")
+        count = rows_by_category[category]
+        channels = channels_by_category[category]
+        logger.info(f"  {category}: {count:,} rows ({', '.join(channels)})")
 
-    logger.info(f"\nTotal: {len(all_rows):,} rows")
+    logger.info(f"\nTotal: {total_rows:,} rows")
     logger.info(f"\nOutput directory: {output_dir}")
 
 
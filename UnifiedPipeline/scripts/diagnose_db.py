@@ -69,8 +69,7 @@ def check_wal_backup(db_path, wal_backup_path, account_name, script_dir):
     # Load CMS
     cms_path = script_dir.parent / 'output' / 'analytics' / f'{account_name}_cms_enriched.json'
     if cms_path.exists():
-        with open(cms_path) as f:
-            cms_videos = json.load(f)
+        cms_videos = json.loads(cms_path.read_bytes())
         cms_video_ids = set(str(v.get('id')) for v in cms_videos)
         missing_from_db = cms_video_ids - db_video_ids
         print(f"Videos in CMS: {len(cms_video_ids):,}")
@@ -406,8 +405,7 @@ def main():
             cms_path = script_dir.parent / 'output' / 'analytics' / f'{args.account}_cms_enriched.json'
             if cms_path.exists():
                 import json
-                with open(cms_path) as f:
-                    cms_videos = json.load(f)
+                cms_videos = json.loads(cms_path.read_bytes())
 
                 # Get all video IDs from DB for this account
                 db_video_ids = set(row[0] for row in conn.execute(
@@ -20,8 +20,8 @@ from shared import (
     get_output_paths,
     init_analytics_db,
     get_all_video_max_dates,
+    json_loads,
 )
-import json
 
 
 def analyze_video_coverage(args):
@@ -82,8 +82,7 @@ def analyze_video_coverage(args):
             logger.warning(f"CMS data not found: {cms_path}")
             continue
 
-        with open(cms_path, 'r', encoding='utf-8') as f:
-            cms_videos = json.load(f)
+        cms_videos = json_loads(cms_path.read_bytes())
 
         total_cms_videos += len(cms_videos)
 
@@ -36,6 +36,7 @@ from shared import (
     setup_logging,
     get_output_paths,
     init_analytics_db,
+    drop_legacy_indexes,
     get_db_stats,
 )
 
@@ -90,6 +91,8 @@ def merge_db(source_path: Path, target_conn, logger) -> int:
         col_list = ", ".join(columns)
         placeholders = ", ".join(["?" for _ in columns])
 
+        drop_legacy_indexes(target_conn)
+
         # Use register to make DataFrame available
         target_conn.register("source_data", source_data)
 
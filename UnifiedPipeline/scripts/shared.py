@@ -13,13 +13,21 @@ import os
 import time
 import random
 import logging
+import threading
+import weakref
 from base64 import b64encode
 from pathlib import Path
 from datetime import datetime, timedelta
-from typing import Dict, Any, Optional, List, Tuple
+from typing import Dict, Any, Optional, List, Tuple, Iterable, Iterator, Union
 import requests
+from requests.adapters import HTTPAdapter
 from requests.exceptions import RequestException, HTTPError
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # =============================================================================
 # LOGGING SETUP
 # =============================================================================
@@ -144,6 +152,7 @@ class BrightcoveAuthManager:
         self.token: Optional[str] = None
         self.token_created_at: float = 0
         self.token_expires_in: int = 300  # Default 5 minutes
+        self._lock = threading.Lock()
 
         self.logger = logging.getLogger('AuthManager')
 
@@ -151,7 +160,22 @@ class BrightcoveAuthManager:
         """Get a valid access token, refreshing if necessary."""
         if self._is_token_valid():
             return self.token
-        return self._refresh_token()
+        with self._lock:
+            # Another thread may have refreshed while we waited for the lock
+            if self._is_token_valid():
+                return self.token
+            return self._refresh_token()
+
+    def invalidate_token(self, token: str) -> None:
+        """
+        Discard a token the API rejected (401) so the next get_token() refreshes.
+
+        Only clears if it is still the current token, so several threads
+        reporting the same stale token cause a single refresh.
+        """
+        with self._lock:
+            if self.token == token:
+                self.token = None
 
     def _is_token_valid(self) -> bool:
         """Check if current token is still valid."""
@@ -204,13 +228,17 @@ class RetryConfig:
                  max_delay: float = 120.0,
                  exponential_base: float = 2.0,
                  jitter_factor: float = 0.5,
-                 retryable_codes: Optional[List[int]] = None):
+                 retryable_codes: Optional[List[int]] = None,
+                 window_retries: int = 2):
         self.max_retries = max_retries
         self.initial_delay = initial_delay
         self.max_delay = max_delay
         self.exponential_base = exponential_base
         self.jitter_factor = jitter_factor
         self.retryable_codes = retryable_codes or [429, 500, 502, 503, 504]
+        # Extra backoff rounds for a whole window that is being throttled,
+        # before falling back to splitting it
+        self.window_retries = window_retries
 
     @classmethod
     def from_settings(cls, settings: Dict) -> 'RetryConfig':
@@ -222,10 +250,19 @@ class RetryConfig:
             max_delay=retry_settings.get('max_delay_seconds', 120.0),
             exponential_base=retry_settings.get('exponential_base', 2.0),
             jitter_factor=retry_settings.get('jitter_factor', 0.5),
-            retryable_codes=retry_settings.get('retryable_status_codes', [429, 500, 502, 503, 504])
+            retryable_codes=retry_settings.get('retryable_status_codes', [429, 500, 502, 503, 504]),
+            window_retries=retry_settings.get('window_retries', 2)
         )
 
 
+class RetryExhaustedError(RuntimeError):
+    """Raised by robust_api_call when all retries fail and raise_on_failure is set."""
+
+    def __init__(self, message: str, status_code: Optional[int] = None):
+        super().__init__(message)
+        self.status_code = status_code
+
+
 def calculate_delay(attempt: int, config: RetryConfig) -> float:
     """Calculate delay with exponential backoff and jitter."""
     base_delay = config.initial_delay * (config.exponential_base ** attempt)
@@ -236,13 +273,30 @@ def calculate_delay(attempt: int, config: RetryConfig) -> float:
     return base_delay + jitter
 
 
+def create_http_session(pool_size: int = 32) -> requests.Session:
+    """
+    Create a requests.Session with a connection pool sized for concurrent use.
+
+    Reusing one session keeps TCP/TLS connections alive across calls instead
+    of paying a handshake per request. Retries stay in robust_api_call.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=0)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
 def robust_api_call(
     url: str,
     headers: Dict[str, str],
     params: Optional[Dict] = None,
     retry_config: Optional[RetryConfig] = None,
     proxies: Optional[Dict] = None,
-    logger: Optional[logging.Logger] = None
+    logger: Optional[logging.Logger] = None,
+    raise_on_failure: bool = False,
+    session: Optional[requests.Session] = None,
+    auth_manager: Optional[BrightcoveAuthManager] = None
 ) -> Optional[requests.Response]:
     """
     Make an API call with robust retry logic.
@@ -252,9 +306,13 @@ def robust_api_call(
     - Handles rate limits (429) with Retry-After header
     - Configurable retry behavior
     - Detailed logging
+    - Optional shared session for connection reuse
+    - With auth_manager: on 401, refreshes the token once and retries.
+      headers is updated in place so callers reusing it get the new token.
 
     Returns:
         Response object on success, None on permanent failure
+        (or RetryExhaustedError carrying the last HTTP status if raise_on_failure)
     """
     if retry_config is None:
         retry_config = RetryConfig()
@@ -263,10 +321,13 @@ def robust_api_call(
         logger = logging.getLogger('API')
 
     last_exception = None
+    last_status = None
+    token_refreshed = False
+    http = session if session is not None else requests
 
     for attempt in range(retry_config.max_retries):
         try:
-            response = requests.get(
+            response = http.get(
                 url,
                 headers=headers,
                 params=params,
@@ -278,6 +339,17 @@ def robust_api_call(
             if response.status_code == 200:
                 return response
 
+            last_status = response.status_code
+
+            # Expired/revoked token - refresh once and retry immediately
+            if response.status_code == 401 and auth_manager is not None and not token_refreshed:
+                token_refreshed = True
+                stale_token = headers.get("Authorization", "").replace("Bearer ", "", 1)
+                auth_manager.invalidate_token(stale_token)
+                headers["Authorization"] = f"Bearer {auth_manager.get_token()}"
+                logger.warning("Unauthorized (401). Refreshed access token, retrying")
+                continue
+
             # Rate limit - respect Retry-After header
             if response.status_code == 429:
                 retry_after = response.headers.get('Retry-After')
@@ -322,41 +394,138 @@ def robust_api_call(
     logger.error(
         f"All {retry_config.max_retries} retries exhausted. Last error: {last_exception}"
     )
+    if raise_on_failure:
+        raise RetryExhaustedError(
+            f"All {retry_config.max_retries} retries exhausted for {url} "
+            f"(last status: {last_status})",
+            status_code=last_status
+        )
     return None
 
 
+def analytics_item_count(data: Dict[str, Any]) -> Optional[int]:
+    """
+    Total row count reported by an Analytics API /v1/data response
+    (item_count), or None if the response does not include it.
+    """
+    total = data.get("item_count")
+    return total if isinstance(total, int) else None
+
+
+def is_last_analytics_page(data: Dict[str, Any], page_size: int, next_offset: int, limit: int) -> bool:
+    """
+    Check whether an Analytics API /v1/data page is the last one.
+
+    A short page always ends paging. A full page ends it only when the
+    response reports item_count and next_offset has reached it; without
+    item_count, paging continues until a short page.
+    """
+    if page_size < limit:
+        return True
+    total = analytics_item_count(data)
+    return total is not None and next_offset >= total
+
+
+# =============================================================================
+# JSON SERIALIZATION
+# =============================================================================
+
+def json_dumps_bytes(data: Any, indent: bool = True, default=None) -> bytes:
+    """
+    Serialize data to UTF-8 JSON bytes.
+
+    Uses orjson when installed (several times faster on large outputs),
+    otherwise falls back to the stdlib json module.
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        if default is not None:
+            # Let default format datetimes, as the stdlib path does
+            option |= orjson.OPT_PASSTHROUGH_DATETIME
+        return orjson.dumps(data, default=default, option=option)
+
+    return json.dumps(data, indent=2 if indent else None, default=default).encode('utf-8')
+
+
+def json_array_chunks(items: List[Any], chunk_size: int = 1000) -> Iterator[bytes]:
+    """
+    Serialize a list as an indented JSON array, chunk_size items at a time.
+
+    The concatenated chunks are byte-identical to json_dumps_bytes(items),
+    but only one chunk's encoding is held in memory at a time.
+    """
+    if not items:
+        yield json_dumps_bytes(items)
+        return
+
+    yield b'['
+    for start in range(0, len(items), chunk_size):
+        encoded = json_dumps_bytes(items[start:start + chunk_size])
+        # Strip the chunk's own '[' and '\n]', joining chunks with ','
+        if start:
+            yield b','
+        yield encoded[1:-2]
+    yield b'\n]'
+
+
+def json_loads(data: Any) -> Any:
+    """Parse JSON from bytes or str, using orjson when installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
 # =============================================================================
 # CHECKPOINT UTILITIES
 # =============================================================================
 
-def save_checkpoint_atomic(path: Path, data: Dict[str, Any]) -> None:
+def write_bytes_atomic(path: Path, data: Union[bytes, Iterable[bytes]], fsync: bool = True) -> None:
     """
-    Save checkpoint atomically to prevent corruption on crash.
+    Write data to path via a temp file and atomic rename.
 
-    Uses write-to-temp-then-rename pattern for atomic writes.
+    data is either bytes or an iterable of byte chunks (e.g. from
+    json_array_chunks) written in order. Readers never see a truncated
+    file: they get either the old or the new contents. fsync=False skips
+    the flush-to-disk for outputs that can be regenerated.
     """
     path = Path(path)
     path.parent.mkdir(parents=True, exist_ok=True)
 
-    temp_path = path.with_suffix('.tmp')
+    # Keep the full name so e.g. x.json and x.jsonl get distinct temp files
+    temp_path = path.with_name(path.name + '.tmp')
 
-    with open(temp_path, 'w', encoding='utf-8') as f:
-        json.dump(data, f, indent=2, default=str)
-        f.flush()
-        os.fsync(f.fileno())
+    with open(temp_path, 'wb') as f:
+        if isinstance(data, (bytes, bytearray)):
+            f.write(data)
+        else:
+            for chunk in data:
+                f.write(chunk)
+        if fsync:
+            f.flush()
+            os.fsync(f.fileno())
 
     # Atomic rename (on POSIX systems)
     os.replace(temp_path, path)
 
 
+def save_checkpoint_atomic(path: Path, data: Dict[str, Any]) -> None:
+    """
+    Save checkpoint atomically to prevent corruption on crash.
+
+    Uses write-to-temp-then-rename pattern for atomic writes.
+    """
+    write_bytes_atomic(path, json_dumps_bytes(data, default=str))
+
+
 def load_checkpoint(path: Path) -> Optional[Dict[str, Any]]:
     """Load checkpoint file if it exists."""
     path = Path(path)
     if not path.exists():
         return None
 
-    with open(path, 'r', encoding='utf-8') as f:
-        return json.load(f)
+    return json_loads(path.read_bytes())
 
 
 def append_checkpoint_line(path: Path, data: Dict[str, Any]) -> None:
@@ -364,8 +533,8 @@ def append_checkpoint_line(path: Path, data: Dict[str, Any]) -> None:
     path = Path(path)
     path.parent.mkdir(parents=True, exist_ok=True)
 
-    with open(path, 'a', encoding='utf-8') as f:
-        f.write(json.dumps(data, default=str) + '\n')
+    with open(path, 'ab') as f:
+        f.write(json_dumps_bytes(data, indent=False, default=str) + b'\n')
         f.flush()
 
 
@@ -376,11 +545,11 @@ def load_checkpoint_jsonl(path: Path) -> List[Dict[str, Any]]:
         return []
 
     rows = []
-    with open(path, 'r', encoding='utf-8') as f:
+    with open(path, 'rb') as f:
         for line in f:
             line = line.strip()
             if line:
-                rows.append(json.loads(line))
+                rows.append(json_loads(line))
     return rows
 
 
@@ -404,13 +573,16 @@ def generate_windows(
     Returns:
         List of (from_date, to_date) tuples
     """
-    start_dt = datetime.strptime(start_date, "%Y-%m-%d")
+    # fromisoformat/isoformat are much cheaper than strptime/strftime for
+    # plain YYYY-MM-DD strings
+    start_dt = datetime.fromisoformat(start_date)
 
     if end_date == 'now':
         end_dt = datetime.now()
     else:
-        end_dt = datetime.strptime(end_date, "%Y-%m-%d")
+        end_dt = datetime.fromisoformat(end_date)
 
+    today = datetime.now().date()
     windows = []
     current = start_dt
 
@@ -449,10 +621,10 @@ def generate_windows(
             window_end = end_dt
 
         # Determine if this is a "live" window
-        is_live = window_end.date() >= datetime.now().date()
-        to_str = 'now' if is_live else window_end.strftime("%Y-%m-%d")
+        is_live = window_end.date() >= today
+        to_str = 'now' if is_live else window_end.date().isoformat()
 
-        windows.append((current.strftime("%Y-%m-%d"), to_str))
+        windows.append((current.date().isoformat(), to_str))
 
         if window_end >= end_dt:
             break
@@ -464,12 +636,12 @@ def generate_windows(
 
 def split_window(from_date: str, to_date: str) -> List[Tuple[str, str]]:
     """Split a window in half."""
-    start = datetime.strptime(from_date, "%Y-%m-%d")
+    start = datetime.fromisoformat(from_date)
 
     if to_date == 'now':
         end = datetime.now()
     else:
-        end = datetime.strptime(to_date, "%Y-%m-%d")
+        end = datetime.fromisoformat(to_date)
 
     days = (end - start).days
     if days <= 1:
@@ -483,18 +655,18 @@ def split_window(from_date: str, to_date: str) -> List[Tuple[str, str]]:
     to_str = to_date if to_date == 'now' else to_date
 
     return [
-        (from_date, mid.strftime("%Y-%m-%d")),
-        (next_day.strftime("%Y-%m-%d"), to_str)
+        (from_date, mid.date().isoformat()),
+        (next_day.date().isoformat(), to_str)
     ]
 
 
 def get_date_range_days(from_date: str, to_date: str) -> int:
     """Calculate the number of days in a date range."""
-    start = datetime.strptime(from_date, "%Y-%m-%d")
+    start = datetime.fromisoformat(from_date)
     if to_date == 'now':
         end = datetime.now()
     else:
-        end = datetime.strptime(to_date, "%Y-%m-%d")
+        end = datetime.fromisoformat(to_date)
     return (end - start).days
 
 
@@ -613,18 +785,28 @@ def init_analytics_db(db_path: Optional[Path] = None) -> 'duckdb.DuckDBPyConnect
         )
     """)
 
-    # Create index for common queries
-    conn.execute("""
-        CREATE INDEX IF NOT EXISTS idx_daily_analytics_video
-        ON daily_analytics (video_id, date)
-    """)
+    return conn
 
-    conn.execute("""
-        CREATE INDEX IF NOT EXISTS idx_daily_analytics_account_date
-        ON daily_analytics (account_id, date)
-    """)
 
-    return conn
+# Connections drop_legacy_indexes has already run on
+_legacy_indexes_dropped = weakref.WeakSet()
+
+
+def drop_legacy_indexes(conn: 'duckdb.DuckDBPyConnection') -> None:
+    """
+    Drop the secondary indexes older versions created on daily_analytics.
+
+    DuckDB answers the GROUP BY / range queries here with zonemaps, while
+    every upsert had to maintain the extra ART indexes. Called from the
+    write paths rather than init_analytics_db, so read-only tools never
+    modify the database. Runs once per connection.
+    """
+    if conn in _legacy_indexes_dropped:
+        return
+
+    conn.execute("DROP INDEX IF EXISTS idx_daily_analytics_video")
+    conn.execute("DROP INDEX IF EXISTS idx_daily_analytics_account_date")
+    _legacy_indexes_dropped.add(conn)
 
 
 def upsert_daily_analytics(
@@ -636,6 +818,9 @@ def upsert_daily_analytics(
     Upsert rows into daily_analytics table.
 
     Uses INSERT OR REPLACE to handle duplicates (same account_id, video_id, date).
+    With pyarrow installed the rows are handed to DuckDB as one columnar
+    Arrow table and upserted in a single statement, which is orders of
+    magnitude faster than executemany's per-row round-trips.
 
     Args:
         conn: DuckDB connection
@@ -651,6 +836,8 @@ def upsert_daily_analytics(
     if logger is None:
         logger = logging.getLogger('DuckDB')
 
+    drop_legacy_indexes(conn)
+
     # Define column order matching table schema
     columns = [
         'account_id', 'video_id', 'date', 'channel', 'name',
@@ -669,9 +856,44 @@ def upsert_daily_analytics(
         'report_generated_on', 'data_type'
     ]
 
+    column_names = ', '.join(columns)
+
+    try:
+        import pyarrow as pa
+    except ImportError:
+        pa = None
+
+    table = None
+    if pa is not None:
+        # One statement may not touch the same key twice, so keep only the
+        # last row per key (what sequential per-row upserts would leave)
+        unique_rows = list({
+            (row.get('account_id'), row.get('video_id'), row.get('date')): row
+            for row in rows
+        }.values())
+
+        try:
+            table = pa.Table.from_pydict({
+                col: [row.get(col) for row in unique_rows] for col in columns
+            })
+        except (pa.ArrowInvalid, pa.ArrowTypeError) as e:
+            # Mixed Python types in a column; let DuckDB cast row by row
+            logger.debug(f"Arrow conversion failed ({e}), using executemany")
+
+    if table is not None:
+        conn.register('_daily_analytics_batch', table)
+        try:
+            conn.execute(f"""
+                INSERT OR REPLACE INTO daily_analytics ({column_names})
+                SELECT {column_names} FROM _daily_analytics_batch
+            """)
+        finally:
+            conn.unregister('_daily_analytics_batch')
+
+        return len(unique_rows)
+
     # Build INSERT OR REPLACE statement
     placeholders = ', '.join(['?' for _ in columns])
-    column_names = ', '.join(columns)
 
     sql = f"""
         INSERT OR REPLACE INTO daily_analytics ({column_names})
@@ -860,11 +1082,10 @@ def calculate_overlap_start_date(
     if not last_processed_date:
         return year_start
 
-    last_dt = datetime.strptime(last_processed_date, "%Y-%m-%d")
-    overlap_dt = last_dt - timedelta(days=overlap_days)
-    year_start_dt = datetime.strptime(year_start, "%Y-%m-%d")
-
-    # Don't go before year start
-    start_dt = max(overlap_dt, year_start_dt)
+    # fromisoformat/isoformat instead of strptime/strftime: this runs once
+    # per video per year
+    last_dt = datetime.fromisoformat(last_processed_date)
+    overlap_date = (last_dt - timedelta(days=overlap_days)).date().isoformat()
 
-    return start_dt.strftime("%Y-%m-%d")
+    # Don't go before year start (ISO dates compare correctly as strings)
+    return max(overlap_date, year_start)
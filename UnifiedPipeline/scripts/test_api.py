@@ -37,8 +37,7 @@ def main():
 
     # Pick a known video ID from CMS
     cms_path = script_dir.parent / 'output' / 'analytics' / 'Internet_cms_enriched.json'
-    with open(cms_path) as f:
-        cms = json.load(f)
+    cms = json.loads(cms_path.read_bytes())
 
     # Find a video created before 2024
     test_video = None
@@ -0,0 +1,122 @@
+"""
+Batching tests for 3_daily_analytics.py with a mocked Analytics API.
+Run: python test_daily_analytics.py
+"""
+import sys
+import logging
+import unittest
+import importlib.util
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+# The script name starts with a digit, so load it by path
+_spec = importlib.util.spec_from_file_location(
+    "daily_analytics", Path(__file__).parent / "3_daily_analytics.py"
+)
+daily_analytics = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(daily_analytics)
+
+# Rows the mocked API holds for the summary and device queries, in date order
+SUMMARY_ITEMS = [
+    {"video": "111", "date": "2025-01-01", "video_view": 3, "video_impression": 10},
+    {"video": "222", "date": "2025-01-01", "video_view": 0, "video_impression": 4},
+    {"video": "111", "date": "2025-01-02", "video_view": 5, "video_impression": 12},
+]
+DEVICE_ITEMS = [
+    {"video": "111", "date": "2025-01-01", "device_type": "desktop", "video_view": 2},
+    {"video": "111", "date": "2025-01-01", "device_type": "tv", "video_view": 1},
+    {"video": "111", "date": "2025-01-02", "device_type": "mobile", "video_view": 4},
+    {"video": "111", "date": "2025-01-02", "device_type": "other", "video_view": 1},
+]
+
+
+class FakeAuthManager:
+    def get_token(self):
+        return "token"
+
+
+class FakeResponse:
+    def __init__(self, data):
+        self._data = data
+
+    def json(self):
+        return self._data
+
+
+class FetchVideoAnalyticsBatchTest(unittest.TestCase):
+
+    def setUp(self):
+        self.requests = []
+
+    def fake_api_call(self, url, headers, params, **kwargs):
+        """Answer a where=video==a,b,... query the way /v1/data does."""
+        self.requests.append(params)
+        video_ids = params["where"].split("==", 1)[1].split(",")
+        source = DEVICE_ITEMS if "device_type" in params["dimensions"] else SUMMARY_ITEMS
+        items = [item for item in source if item["video"] in video_ids]
+        page = items[params["offset"]:params["offset"] + params["limit"]]
+        return FakeResponse({"item_count": len(items), "items": page, "summary": {}})
+
+    def fetch(self, video_ids):
+        with mock.patch.object(daily_analytics, "robust_api_call", side_effect=self.fake_api_call):
+            return daily_analytics.fetch_video_analytics_batch(
+                video_ids=video_ids,
+                account_id="123",
+                from_date="2025-01-01",
+                to_date="2025-12-31",
+                auth_manager=FakeAuthManager(),
+                retry_config=None,
+                proxies={},
+                logger=logging.getLogger(__name__),
+            )
+
+    def test_one_response_split_per_video(self):
+        results = self.fetch(["111", "222", "333"])
+
+        self.assertEqual(set(results), {"111", "222", "333"})
+
+        summary, devices = results["111"]
+        self.assertEqual([item["date"] for item in summary], ["2025-01-01", "2025-01-02"])
+        self.assertEqual([item["video_view"] for item in summary], [3, 5])
+        # TV views are folded into "other"
+        self.assertEqual(devices, {
+            "2025-01-01": {"desktop": 2, "other": 1},
+            "2025-01-02": {"mobile": 4, "other": 1},
+        })
+
+        summary, devices = results["222"]
+        self.assertEqual([item["video_impression"] for item in summary], [4])
+        self.assertEqual(devices, {})
+
+        # A video without rows still gets an (empty) entry
+        self.assertEqual(results["333"], ([], {}))
+
+    def test_one_request_per_query(self):
+        self.fetch(["111", "222", "333"])
+
+        self.assertEqual([params["where"] for params in self.requests], [
+            "video==111,222,333",
+            # Only videos with views get the device breakdown
+            "video==111",
+        ])
+
+    def test_pages_are_followed(self):
+        with mock.patch.object(daily_analytics, "robust_api_call", side_effect=self.fake_api_call):
+            items = daily_analytics.fetch_all_items(
+                {"dimensions": "date,video", "where": "video==111,222"},
+                headers={},
+                auth_manager=FakeAuthManager(),
+                retry_config=None,
+                proxies={},
+                logger=logging.getLogger(__name__),
+                page_limit=2,
+            )
+
+        self.assertEqual(items, SUMMARY_ITEMS)
+        self.assertEqual([params["offset"] for params in self.requests], [0, 2])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,153 @@
+"""
+Tests for 2_dt_last_viewed.py: paging against a mocked Analytics API and
+the .xlsx export read back with openpyxl.
+Run: python test_dt_last_viewed.py
+"""
+import sys
+import logging
+import tempfile
+import threading
+import unittest
+import importlib.util
+from pathlib import Path
+from unittest import mock
+
+try:
+    import openpyxl
+except ImportError:
+    openpyxl = None
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+# The script name starts with a digit, so load it by path
+_spec = importlib.util.spec_from_file_location(
+    "dt_last_viewed", Path(__file__).parent / "2_dt_last_viewed.py"
+)
+dt_last_viewed = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(dt_last_viewed)
+
+PAGE_LIMIT = 10000
+
+
+class FakeAuthManager:
+    def get_token(self):
+        return "token"
+
+
+class FakeResponse:
+    def __init__(self, data):
+        self._data = data
+
+    def json(self):
+        return self._data
+
+
+def analytics_response(total: int, offset: int, limit: int) -> dict:
+    """A /v1/data response in the real shape: item_count, items, summary."""
+    items = [
+        {"video": f"v{i}", "date": "2025-01-15", "video_view": 1}
+        for i in range(offset, min(offset + limit, total))
+    ]
+    return {"item_count": total, "items": items, "summary": {"video_view": total}}
+
+
+class FetchAnalyticsSliceTest(unittest.TestCase):
+
+    def fetch(self, fake_api_call, page_concurrency):
+        last_map = {}
+        with mock.patch.object(dt_last_viewed, "robust_api_call", side_effect=fake_api_call):
+            rows = dt_last_viewed.fetch_analytics_slice(
+                auth_manager=FakeAuthManager(),
+                account_id="123",
+                from_date="2025-01-01",
+                to_date="2025-01-31",
+                last_map=last_map,
+                retry_config=None,
+                proxies={},
+                logger=logging.getLogger(__name__),
+                page_concurrency=page_concurrency,
+            )
+        return rows, last_map
+
+    def test_stops_at_item_count(self):
+        offsets = []
+
+        def fake_api_call(url, headers, params, **kwargs):
+            offsets.append(params["offset"])
+            return FakeResponse(analytics_response(2 * PAGE_LIMIT, params["offset"], params["limit"]))
+
+        rows, last_map = self.fetch(fake_api_call, page_concurrency=1)
+
+        self.assertEqual(rows, 2 * PAGE_LIMIT)
+        self.assertEqual(len(last_map), 2 * PAGE_LIMIT)
+        # No round-trip for the empty page after the last full one
+        self.assertEqual(offsets, [0, PAGE_LIMIT])
+
+    def test_remaining_pages_fetched_concurrently(self):
+        offsets = []
+        lock = threading.Lock()
+        # Both remaining pages must be in flight at once to pass the barrier
+        barrier = threading.Barrier(2, timeout=5)
+
+        def fake_api_call(url, headers, params, **kwargs):
+            with lock:
+                offsets.append(params["offset"])
+            if params["offset"] > 0:
+                barrier.wait()
+            return FakeResponse(analytics_response(3 * PAGE_LIMIT, params["offset"], params["limit"]))
+
+        rows, last_map = self.fetch(fake_api_call, page_concurrency=2)
+
+        self.assertEqual(rows, 3 * PAGE_LIMIT)
+        self.assertEqual(len(last_map), 3 * PAGE_LIMIT)
+        self.assertEqual(sorted(offsets), [0, PAGE_LIMIT, 2 * PAGE_LIMIT])
+
+
+@unittest.skipUnless(openpyxl, "openpyxl is required to read the workbook back")
+class WriteXlsxFastTest(unittest.TestCase):
+
+    def setUp(self):
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.excel_path = Path(temp_dir.name) / "videos_cms.xlsx"
+
+    def read_back(self):
+        sheet = openpyxl.load_workbook(self.excel_path).active
+        return [list(row) for row in sheet.iter_rows(values_only=True)]
+
+    def test_cell_values_round_trip(self):
+        columns = ["escaped", "markup", "control", "long", "flag", "missing", "nan", "padded", "count", "rate"]
+        rows = [
+            ["Q&A", "<b>x</b>", "a\x01b\x1fc\x7f", "x" * 40000, True, None, float("nan"), "  indented", 42, 0.25],
+            ["", "", "", "", False, None, None, "trailing ", -7, 1e20],
+        ]
+
+        dt_last_viewed.write_xlsx_fast(columns, iter(rows), self.excel_path)
+
+        header, first, second = self.read_back()
+        self.assertEqual(header, columns)
+        self.assertEqual(first[:3], ["Q&A", "<b>x</b>", "abc"])
+        self.assertEqual(len(first[3]), dt_last_viewed.EXCEL_MAX_STRING_LENGTH)
+        self.assertEqual(first[4:], [True, None, None, "  indented", 42, 0.25])
+        self.assertEqual(second, [None, None, None, None, False, None, None, "trailing ", -7, 1e20])
+
+    def test_header_is_bold(self):
+        dt_last_viewed.write_xlsx_fast(["id", "name"], iter([["1", "a"]]), self.excel_path)
+
+        sheet = openpyxl.load_workbook(self.excel_path).active
+        self.assertTrue(sheet["A1"].font.bold)
+        self.assertFalse(sheet["A2"].font.bold)
+
+    def test_failed_write_leaves_no_temp_file(self):
+        def rows():
+            yield ["1", "a"]
+            raise RuntimeError("source failed")
+
+        with self.assertRaises(RuntimeError):
+            dt_last_viewed.write_xlsx_fast(["id", "name"], rows(), self.excel_path)
+
+        self.assertEqual(list(self.excel_path.parent.iterdir()), [])
+
+
+if __name__ == "__main__":
+    unittest.main()